@@ -2,92 +2,85 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib.patches import Rectangle, Circle
+from matplotlib.collections import PatchCollection, PolyCollection
 from matplotlib.lines import Line2D
 import csv
+import atexit
 from datetime import datetime
 import os
+import time
 import math
+import functools
+from collections import ChainMap
+import logging
+
+log = logging.getLogger(__name__)  # Planner DEBUG traces; silent unless logging is configured
 
 # --- Helper Functions ---
 SOWN_SEGMENTS_LOG = set()
-
-def _commit_point_to_path(points_list_lanes, sow_flags_list, new_lane_point, sow_flag_requested, context=""):
-    # new_lane_point is (lane_x, lane_y)
-    if not points_list_lanes:
-        points_list_lanes.append(new_lane_point)
+POINTS_PER_SEGMENT = 25  # Interpolated animation frames per path segment
+PERIMETER_MAX_POINTS = 32  # Headland/exit-approach waypoints added after the inner sweep (at most ~10 in practice)
+NON_INTERACTIVE_BACKENDS = ('agg', 'pdf', 'svg', 'ps', 'pgf', 'cairo', 'template')  # Blitting buys nothing on these
+# Row label boxes; Text.set_bbox copies its props, so every label can share one dict
+VROW_LABEL_BBOX = dict(boxstyle="round,pad=0.3", fc='lightblue', alpha=0.9, ec='navy', lw=2)
+HROW_LABEL_BBOX = dict(boxstyle="round,pad=0.3", fc='lightgreen', alpha=0.9, ec='darkgreen', lw=2)
+TELEMETRY_CSV_HEADER = ("Timestamp", "Step", "Label", "From (m)", "To (m)", "FromY (m)", "ToY (m)", "Dir", "Action", "FarmType",
+                        "Status", "SegDist (m)", "TotalDist (m)", "SownDist (m)", "V_Sown_Segs", "H_Sown_Segs")
+
+class _WaypointBuffer:
+    """Preallocated lane-point storage: (capacity, 2) int32 points and one sow flag per segment."""
+    def __init__(self, capacity=64):
+        self.points = np.empty((max(capacity, 2), 2), dtype=np.int32)
+        self.sow_flags = np.empty(max(capacity, 2) - 1, dtype=np.bool_)
+        self.n = 0  # Number of committed points; segment i ends at point i + 1
+        self.last_point = None
+
+    def _reserve(self, extra):
+        while self.n + extra > len(self.points):  # Out of room: double capacity
+            self.points = np.concatenate([self.points, np.empty_like(self.points)])
+            self.sow_flags = np.concatenate([self.sow_flags, np.empty(len(self.sow_flags) + 1, dtype=np.bool_)])
+
+    def append(self, lane_point, sow_flag=False):
+        self._reserve(1)
+        self.points[self.n] = lane_point
+        if self.n > 0: self.sow_flags[self.n - 1] = sow_flag
+        self.n += 1
+        self.last_point = lane_point
+
+    def extend(self, lane_points, sow_flags):
+        # Bulk append after at least one point: sow_flags[k] is for the segment ending at lane_points[k]
+        m = len(lane_points)
+        self._reserve(m)
+        self.points[self.n:self.n + m] = lane_points
+        self.sow_flags[self.n - 1:self.n - 1 + m] = sow_flags
+        self.n += m
+        self.last_point = tuple(self.points[self.n - 1].tolist())
+
+    def to_arrays(self):
+        return self.points[:self.n].copy(), self.sow_flags[:max(self.n - 1, 0)].copy()
+
+def _seg_key(a, b):
+    # Order-independent int key for the segment a-b; each lane index gets 32 bits, each point 64
+    a0 = (a[0] << 32) | a[1]; b0 = (b[0] << 32) | b[1]
+    return (min(a0, b0) << 64) | max(a0, b0)
+
+def _commit_point_to_path(path_buf, new_lane_point, sow_flag_requested, context=""):
+    # new_lane_point is (lane_x, lane_y); context is a constant label for readability only
+    if path_buf.n == 0:
+        path_buf.append(new_lane_point)
         return
-    if points_list_lanes[-1] == new_lane_point:
+    if path_buf.last_point == new_lane_point:
         return
 
-    previous_lane_point = points_list_lanes[-1]
-    current_segment = frozenset({previous_lane_point, new_lane_point})
+    previous_lane_point = path_buf.last_point
+    current_segment = _seg_key(previous_lane_point, new_lane_point)
     actual_sow_flag_for_this_segment = False
 
     if sow_flag_requested:
         if current_segment not in SOWN_SEGMENTS_LOG:
             actual_sow_flag_for_this_segment = True
             SOWN_SEGMENTS_LOG.add(current_segment)
-    points_list_lanes.append(new_lane_point)
-    sow_flags_list.append(actual_sow_flag_for_this_segment)
-
-def _add_headland_segment_custom_exit(current_lane_x, current_lane_y, 
-                                     target_lane_x, target_lane_y, 
-                                     exit_point_lanes, 
-                                     _points_list_lanes, _sow_flags_list, 
-                                     segment_label="",
-                                     is_designated_unsown_positioning_leg=False,
-                                     gap_size=1):
-    ex_lane_x, ey_lane_y = exit_point_lanes
-    if (current_lane_x, current_lane_y) == exit_point_lanes:
-        _commit_point_to_path(_points_list_lanes, _sow_flags_list, (target_lane_x, target_lane_y), False, f"AHLCE {segment_label} Case 1")
-        return target_lane_x, target_lane_y
-
-    on_segment_path = False
-    if current_lane_x == target_lane_x == ex_lane_x and min(current_lane_y, target_lane_y) <= ey_lane_y <= max(current_lane_y, target_lane_y):
-        on_segment_path = True
-    elif current_lane_y == target_lane_y == ey_lane_y and min(current_lane_x, target_lane_x) <= ex_lane_x <= max(current_lane_x, target_lane_x):
-        on_segment_path = True
-
-    if on_segment_path:
-        # Calculate stop point before exit to leave gap
-        if current_lane_x == target_lane_x == ex_lane_x:  # Vertical movement
-            if current_lane_y < ey_lane_y:  # Moving upward
-                sow_stop_y = max(current_lane_y, ey_lane_y - gap_size)
-            else:  # Moving downward
-                sow_stop_y = min(current_lane_y, ey_lane_y + gap_size)
-            
-            # Sow until stop point
-            if sow_stop_y != current_lane_y:
-                _commit_point_to_path(_points_list_lanes, _sow_flags_list, (ex_lane_x, sow_stop_y), True, f"AHLCE {segment_label} Case 2 SowToGap")
-            
-            # Unsown movement to exit
-            _commit_point_to_path(_points_list_lanes, _sow_flags_list, (ex_lane_x, ey_lane_y), False, f"AHLCE {segment_label} Case 2 ToExit")
-            
-            # Continue unsown to target if needed
-            if (ex_lane_x, ey_lane_y) != (target_lane_x, target_lane_y):
-                _commit_point_to_path(_points_list_lanes, _sow_flags_list, (target_lane_x, target_lane_y), False, f"AHLCE {segment_label} Case 2 PastExit")
-                
-        elif current_lane_y == target_lane_y == ey_lane_y:  # Horizontal movement
-            if current_lane_x < ex_lane_x:  # Moving rightward
-                sow_stop_x = max(current_lane_x, ex_lane_x - gap_size)
-            else:  # Moving leftward
-                sow_stop_x = min(current_lane_x, ex_lane_x + gap_size)
-            
-            # Sow until stop point
-            if sow_stop_x != current_lane_x:
-                _commit_point_to_path(_points_list_lanes, _sow_flags_list, (sow_stop_x, ey_lane_y), True, f"AHLCE {segment_label} Case 2 SowToGap")
-            
-            # Unsown movement to exit
-            _commit_point_to_path(_points_list_lanes, _sow_flags_list, (ex_lane_x, ey_lane_y), False, f"AHLCE {segment_label} Case 2 ToExit")
-            
-            # Continue unsown to target if needed
-            if (ex_lane_x, ey_lane_y) != (target_lane_x, target_lane_y):
-                _commit_point_to_path(_points_list_lanes, _sow_flags_list, (target_lane_x, target_lane_y), False, f"AHLCE {segment_label} Case 2 PastExit")
-    else: 
-        sow_request = not is_designated_unsown_positioning_leg
-        _commit_point_to_path(_points_list_lanes, _sow_flags_list, (target_lane_x, target_lane_y), sow_request, f"AHLCE {segment_label} Case 3")
-            
-    return target_lane_x, target_lane_y
+    path_buf.append(new_lane_point, actual_sow_flag_for_this_segment)
 
 def get_user_choice_corner_lanes(max_lx_idx, max_ly_idx):
     print(f"\nChoose exit corner (0-indexed lanes: X up to {max_lx_idx}, Y up to {max_ly_idx}):")
@@ -145,124 +138,112 @@ def get_user_defined_exit_lanes(max_lx_idx, max_ly_idx):
     return (ex_l, ey_l)
 
 
-def _commit_partial_vertical_sweep(points_list, sow_flags_list, curr_x, start_y, end_y, gap_size=1):
+@functools.lru_cache(maxsize=32)
+def _inner_sweep_waypoints(lanes_x, start_y, max_y, gap_size=1):
     """
-    Creates a partial vertical sweep with gaps at both ends.
+    Builds the boustrophedon inner sweep in closed form.
     
-    Args:
-        points_list: List of lane points
-        sow_flags_list: List of sowing flags
-        curr_x: Current X lane position
-        start_y: Starting Y lane position
-        end_y: Ending Y lane position  
-        gap_size: Size of gap to leave at each end (in lane units)
-    """
-    if start_y == end_y:
-        return end_y
+    Memoized on its (hashable) arguments, so re-planning the same field with
+    another exit reuses the sweep; the returned arrays are read-only.
     
-    # Determine direction and calculate total distance
-    direction = 1 if end_y > start_y else -1
-    total_distance = abs(end_y - start_y)
+    Each lane is a partial vertical sweep with gaps at both ends (unsown gap,
+    sown middle, unsown gap), followed by an unsown H-turn to the next lane.
+    Sweeps shorter than 2 * gap_size are sown end to end.
     
-    # If total distance is too small for meaningful gaps, do full sown movement
-    if total_distance <= 2 * gap_size:
-        _commit_point_to_path(points_list, sow_flags_list, (curr_x, end_y), True, "PartialSweep_FullSown")
-        return end_y
+    Args:
+        lanes_x: Inner X lanes in sweep order, as a range
+        start_y: Y lane the first sweep starts from (0 or max_y)
+        max_y: Maximum Y lane index
+        gap_size: Size of gap to leave at each end (in lane units)
     
-    # Calculate sowing start and end positions
-    # Leave gap_size at the beginning and end
-    sow_start_y = start_y + (gap_size * direction)
-    sow_end_y = end_y - (gap_size * direction)
+    Returns:
+        (points, sow_requests): (M, 2) int array of lane points following the
+        start point, and the (M,) sow request for the segment ending at each
+    """
+    lanes_x = np.asarray(lanes_x, dtype=np.int64)
+    n_lanes = lanes_x.size
+    if n_lanes == 0:
+        return np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=bool)
     
-    # Phase 1: Unsown movement to sowing start position (creating initial gap)
-    if sow_start_y != start_y:
-        _commit_point_to_path(points_list, sow_flags_list, (curr_x, sow_start_y), False, "PartialSweep_Phase1_Gap")
+    # Sweeps alternate between the two ends: from_y -> to_y, then back
+    from_y = np.where(np.arange(n_lanes) % 2 == 0, start_y, max_y - start_y)
+    to_y = max_y - from_y
+    direction = np.sign(to_y - from_y)
     
-    # Phase 2: Sown movement (main productive sweep)
-    _commit_point_to_path(points_list, sow_flags_list, (curr_x, sow_end_y), True, "PartialSweep_Phase2_Sown")
+    # Stops within each lane as (n_lanes, k) columns
+    if max_y == 0:
+        stop_ys, stop_sows = [], []
+    elif max_y <= 2 * gap_size or gap_size == 0:
+        stop_ys, stop_sows = [to_y], [True]
+    else:
+        stop_ys = [from_y + gap_size * direction, to_y - gap_size * direction, to_y]
+        stop_sows = [False, True, False]
     
-    # Phase 3: Unsown movement to final position (creating final gap)
-    if sow_end_y != end_y:
-        _commit_point_to_path(points_list, sow_flags_list, (curr_x, end_y), False, "PartialSweep_Phase3_Gap")
+    # H-turn to the next lane at the end of each sweep (dropped after the last lane)
+    next_lanes_x = np.append(lanes_x[1:], lanes_x[-1])
+    xs = np.stack([lanes_x] * len(stop_ys) + [next_lanes_x], axis=1)
+    ys = np.stack(stop_ys + [to_y], axis=1)
+    sows = np.broadcast_to(np.array(stop_sows + [False]), xs.shape)
     
-    return end_y
+    points = np.stack([xs.ravel(), ys.ravel()], axis=1)[:-1]
+    sow_requests = sows.ravel()[:-1].copy()
+    points.flags.writeable = False; sow_requests.flags.writeable = False
+    return points, sow_requests
 
 # --- Path Generation (Operates in 0-indexed Lane Numbers) ---
 # Updated helper function to properly handle gap_size parameter
 def _add_headland_segment_custom_exit_with_gaps(current_lane_x, current_lane_y, 
                                      target_lane_x, target_lane_y, 
                                      exit_point_lanes, 
-                                     _points_list_lanes, _sow_flags_list, 
+                                     _path_buf, 
                                      segment_label="",
                                      is_designated_unsown_positioning_leg=False,
                                      gap_size=1):
     ex_lane_x, ey_lane_y = exit_point_lanes
     if (current_lane_x, current_lane_y) == exit_point_lanes:
-        _commit_point_to_path(_points_list_lanes, _sow_flags_list, (target_lane_x, target_lane_y), False, f"AHLCE {segment_label} Case 1")
+        _commit_point_to_path(_path_buf, (target_lane_x, target_lane_y), False, segment_label)
         return target_lane_x, target_lane_y
 
     on_segment_path = False
-    if current_lane_x == target_lane_x == ex_lane_x and min(current_lane_y, target_lane_y) <= ey_lane_y <= max(current_lane_y, target_lane_y):
+    if current_lane_x == target_lane_x == ex_lane_x and (current_lane_y <= ey_lane_y <= target_lane_y or target_lane_y <= ey_lane_y <= current_lane_y):
         on_segment_path = True
-    elif current_lane_y == target_lane_y == ey_lane_y and min(current_lane_x, target_lane_x) <= ex_lane_x <= max(current_lane_x, target_lane_x):
+    elif current_lane_y == target_lane_y == ey_lane_y and (current_lane_x <= ex_lane_x <= target_lane_x or target_lane_x <= ex_lane_x <= current_lane_x):
         on_segment_path = True
 
     if on_segment_path:
-        # [Existing gap logic when exit is on the path - keep unchanged]
-        # Calculate stop point before exit to leave gap
-        if current_lane_x == target_lane_x == ex_lane_x:  # Vertical movement
-            if current_lane_y < ey_lane_y:  # Moving upward
-                sow_stop_y = max(current_lane_y, ey_lane_y - gap_size)
-            else:  # Moving downward
-                sow_stop_y = min(current_lane_y, ey_lane_y + gap_size)
-            
-            # Sow until stop point
-            if sow_stop_y != current_lane_y:
-                _commit_point_to_path(_points_list_lanes, _sow_flags_list, (ex_lane_x, sow_stop_y), True, f"AHLCE {segment_label} Case 2 SowToGap")
-            
-            # Unsown movement to exit
-            _commit_point_to_path(_points_list_lanes, _sow_flags_list, (ex_lane_x, ey_lane_y), False, f"AHLCE {segment_label} Case 2 ToExit")
-            
-            # Continue unsown to target if needed
-            if (ex_lane_x, ey_lane_y) != (target_lane_x, target_lane_y):
-                _commit_point_to_path(_points_list_lanes, _sow_flags_list, (target_lane_x, target_lane_y), False, f"AHLCE {segment_label} Case 2 PastExit")
-                
-        elif current_lane_y == target_lane_y == ey_lane_y:  # Horizontal movement
-            if current_lane_x < ex_lane_x:  # Moving rightward
-                sow_stop_x = max(current_lane_x, ex_lane_x - gap_size)
-            else:  # Moving leftward
-                sow_stop_x = min(current_lane_x, ex_lane_x + gap_size)
-            
-            # Sow until stop point
-            if sow_stop_x != current_lane_x:
-                _commit_point_to_path(_points_list_lanes, _sow_flags_list, (sow_stop_x, ey_lane_y), True, f"AHLCE {segment_label} Case 2 SowToGap")
-            
-            # Unsown movement to exit
-            _commit_point_to_path(_points_list_lanes, _sow_flags_list, (ex_lane_x, ey_lane_y), False, f"AHLCE {segment_label} Case 2 ToExit")
-            
-            # Continue unsown to target if needed
-            if (ex_lane_x, ey_lane_y) != (target_lane_x, target_lane_y):
-                _commit_point_to_path(_points_list_lanes, _sow_flags_list, (target_lane_x, target_lane_y), False, f"AHLCE {segment_label} Case 2 PastExit")
+        past_exit = ex_lane_x != target_lane_x or ey_lane_y != target_lane_y  # Target lies beyond the exit
+        # Calculate stop point before exit to leave gap, along the axis of movement
+        is_vertical = current_lane_x == target_lane_x == ex_lane_x
+        cur, ex = (current_lane_y, ey_lane_y) if is_vertical else (current_lane_x, ex_lane_x)
+        if cur < ex:  # Moving upward / rightward
+            sow_stop = ex - gap_size if ex - gap_size > cur else cur
+        else:  # Moving downward / leftward
+            sow_stop = ex + gap_size if ex + gap_size < cur else cur
+        
+        # Sow until stop point
+        if sow_stop != cur:
+            stop_pt = (ex_lane_x, sow_stop) if is_vertical else (sow_stop, ey_lane_y)
+            _commit_point_to_path(_path_buf, stop_pt, True, segment_label)
+        
+        # Unsown movement to exit
+        _commit_point_to_path(_path_buf, (ex_lane_x, ey_lane_y), False, segment_label)
+        
+        # Continue unsown to target if needed
+        if past_exit:
+            _commit_point_to_path(_path_buf, (target_lane_x, target_lane_y), False, segment_label)
     else: 
         # Exit not on this segment - FIXED: Always sow perimeter segments regardless of gap size
         sow_request = not is_designated_unsown_positioning_leg
-        _commit_point_to_path(_points_list_lanes, _sow_flags_list, (target_lane_x, target_lane_y), sow_request, f"AHLCE {segment_label} Case 3_Fixed")
+        _commit_point_to_path(_path_buf, (target_lane_x, target_lane_y), sow_request, segment_label)
             
     return target_lane_x, target_lane_y
 
 
-def generate_fixed_path(n_inner_x_sweeps, max_lane_idx_x, max_lane_idx_y, exit_point_lanes, is_corner_exit, gap_size=1):
-    global SOWN_SEGMENTS_LOG
-    SOWN_SEGMENTS_LOG.clear()
-
-    _points_lanes = [] # Stores (lane_x, lane_y)
-    _sow_flags = []
+@functools.lru_cache(maxsize=128)
+def _sweep_sequence(n_inner_x_sweeps, max_lane_idx_x, max_lane_idx_y, exit_point_lanes, is_corner_exit):
+    # Inner lane order and start point for an exit; pure, so replanning reuses it
     ex_ln_x, ex_ln_y = exit_point_lanes # Exit point in lane indices
     
-    def _commit(new_ln_pt, sow_req, ctx=""):
-        _commit_point_to_path(_points_lanes, _sow_flags, new_ln_pt, sow_req, ctx)
-
-    # [Previous initialization code remains the same...]
     # Determine start_lane_y for boustrophedon (0 or max_lane_idx_y)
     natural_start_ln_y = 0
     if ex_ln_y == max_lane_idx_y: natural_start_ln_y = max_lane_idx_y
@@ -274,562 +255,545 @@ def generate_fixed_path(n_inner_x_sweeps, max_lane_idx_x, max_lane_idx_y, exit_p
     if n_inner_x_sweeps % 2 != 0: # If odd number of inner sweeps, flip start Y
         b_start_lane_y = 0 if natural_start_ln_y == max_lane_idx_y else max_lane_idx_y
     
-    # Determine start_lane_x for boustrophedon (inner lanes are 1 to max_lane_idx_x - 1)
-    start_sweep_lane_x = -1
-    lanes_to_sweep_x = [] # List of inner lane X-indices (1 to max_lane_idx_x - 1)
-    
+    # Inner lanes are 1 to max_lane_idx_x - 1, swept in order starting from
+    # the side farthest from the exit
     first_inner_lane_x = 1
     last_inner_lane_x = max_lane_idx_x - 1
+    exit_on_left_half = ex_ln_x <= max_lane_idx_x / 2.0
+    # Corner exits sweep every inner lane; custom exits sweep exactly n_inner_x_sweeps lanes
+    n_lanes_x = last_inner_lane_x - first_inner_lane_x + 1 if is_corner_exit else n_inner_x_sweeps
+    
+    if n_inner_x_sweeps <= 0:
+        lanes_to_sweep_x = range(0)
+    elif exit_on_left_half:
+        lanes_to_sweep_x = range(last_inner_lane_x, last_inner_lane_x - n_lanes_x, -1)  # VRow4 → VRow3 → VRow2 → VRow1
+    else:
+        lanes_to_sweep_x = range(first_inner_lane_x, first_inner_lane_x + n_lanes_x)
+    
+    initial_pos_lane_x = lanes_to_sweep_x[0] if n_inner_x_sweeps > 0 else (0 if exit_on_left_half else max_lane_idx_x)
+    return lanes_to_sweep_x, b_start_lane_y, initial_pos_lane_x
+
+def _generate_inner_sweep_path(n_inner_x_sweeps, max_lane_idx_x, max_lane_idx_y, exit_point_lanes, is_corner_exit, gap_size):
+    # Start point plus the boustrophedon inner sweeps, shared by both exit types
+    lanes_to_sweep_x, b_start_lane_y, initial_pos_lane_x = _sweep_sequence(
+        n_inner_x_sweeps, max_lane_idx_x, max_lane_idx_y, tuple(exit_point_lanes), is_corner_exit)
+    sweep_points, sweep_sow_requests = _inner_sweep_waypoints(lanes_to_sweep_x, b_start_lane_y, max_lane_idx_y, gap_size)
+
+    # Stores (lane_x, lane_y) points and per-segment sow flags, sized up front for the
+    # start point, the inner sweep and the perimeter pass so it never has to grow
+    _path = _WaypointBuffer(capacity=1 + len(sweep_points) + PERIMETER_MAX_POINTS)
+    _path.append((initial_pos_lane_x, b_start_lane_y))
+
+    # Inner vertical sweeps: consecutive points always differ and every sown segment
+    # lies in its own lane, so the block is written in one go and only logged per sown segment
+    if len(sweep_points) > 0:
+        _path.extend(sweep_points, sweep_sow_requests)
+        sweep_from = _path.points[_path.n - len(sweep_points) - 1:_path.n - 1]
+        for seg_idx in np.flatnonzero(sweep_sow_requests):
+            SOWN_SEGMENTS_LOG.add(_seg_key(sweep_from[seg_idx].tolist(), sweep_points[seg_idx].tolist()))
+    return _path
+
+def _generate_fixed_path_corner(_path, max_lane_idx_x, max_lane_idx_y, exit_point_lanes):
+    # Perimeter pass from the end of the inner sweeps to a corner exit
+    ex_ln_x, ex_ln_y = exit_point_lanes # Exit point in lane indices
+    curr_ln_x, curr_ln_y = _path.last_point
 
-    if n_inner_x_sweeps == 0:
-        start_sweep_lane_x = 0 if ex_ln_x <= max_lane_idx_x / 2.0 else max_lane_idx_x
+    def _commit(new_ln_pt, sow_req, ctx=""):
+        _commit_point_to_path(_path, new_ln_pt, sow_req, ctx)
+
+    # EFFICIENT CORNER EXIT LOGIC - Stop inner sweeps one row earlier and turn RIGHT
+
+    # Determine efficient perimeter sequence based on exit corner and current position
+    if ex_ln_x == 0 and ex_ln_y == max_lane_idx_y:  # TOP-LEFT corner exit (0, max_y)
+        if curr_ln_y == 0:  # Currently at bottom after inner sweeps
+            # Efficient sequence: HRow2(up) → VRow5(right) → HRow1(down) → VRow1(to exit)
+            _commit((curr_ln_x, max_lane_idx_y), True, "HRow2_EfficientUp")
+            curr_ln_y = max_lane_idx_y
+            _commit((max_lane_idx_x, curr_ln_y), True, "VRow5_EfficientRight") 
+            curr_ln_x = max_lane_idx_x
+            _commit((curr_ln_x, 0), True, "HRow1_EfficientDown")
+            curr_ln_y = 0
+            _commit((0, curr_ln_y), True, "VRow1_EfficientLeft")
+            curr_ln_x = 0
+            _commit((curr_ln_x, ex_ln_y), True, "VRow1_ToExit")
+        else:  # Currently at top after inner sweeps
+            # Efficient sequence: HRow2(right) → VRow5(down) → HRow1(left) → VRow1(to exit)
+            _commit((max_lane_idx_x, curr_ln_y), True, "HRow2_EfficientRight")
+            curr_ln_x = max_lane_idx_x
+            _commit((curr_ln_x, 0), True, "VRow5_EfficientDown")
+            curr_ln_y = 0
+            _commit((0, curr_ln_y), True, "HRow1_EfficientLeft")
+            curr_ln_x = 0
+            _commit((curr_ln_x, ex_ln_y), True, "VRow1_ToExit")
+
+    elif ex_ln_x == max_lane_idx_x and ex_ln_y == max_lane_idx_y:  # TOP-RIGHT corner exit
+        if curr_ln_y == 0:  # Currently at bottom after inner sweeps
+            # Efficient sequence: HRow2(up) → VRow1(left) → HRow1(down) → VRow5(to exit)
+            _commit((curr_ln_x, max_lane_idx_y), True, "HRow2_EfficientUp")
+            curr_ln_y = max_lane_idx_y
+            _commit((0, curr_ln_y), True, "VRow1_EfficientLeft")
+            curr_ln_x = 0
+            _commit((curr_ln_x, 0), True, "HRow1_EfficientDown")
+            curr_ln_y = 0
+            _commit((max_lane_idx_x, curr_ln_y), True, "VRow5_EfficientRight")
+            curr_ln_x = max_lane_idx_x
+            _commit((curr_ln_x, ex_ln_y), True, "VRow5_ToExit")
+        else:  # Currently at top after inner sweeps
+            # Efficient sequence: HRow2(left) → VRow1(down) → HRow1(right) → VRow5(to exit)
+            _commit((0, curr_ln_y), True, "HRow2_EfficientLeft")
+            curr_ln_x = 0
+            _commit((curr_ln_x, 0), True, "VRow1_EfficientDown")
+            curr_ln_y = 0
+            _commit((max_lane_idx_x, curr_ln_y), True, "HRow1_EfficientRight")
+            curr_ln_x = max_lane_idx_x
+            _commit((curr_ln_x, ex_ln_y), True, "VRow5_ToExit")
+
+    elif ex_ln_x == 0 and ex_ln_y == 0:  # BOTTOM-LEFT corner exit
+        if curr_ln_y == max_lane_idx_y:  # Currently at top after inner sweeps
+            # Efficient sequence: HRow1(down) → VRow5(right) → HRow2(up) → VRow1(to exit)
+            _commit((curr_ln_x, 0), True, "HRow1_EfficientDown")
+            curr_ln_y = 0
+            _commit((max_lane_idx_x, curr_ln_y), True, "VRow5_EfficientRight")
+            curr_ln_x = max_lane_idx_x
+            _commit((curr_ln_x, max_lane_idx_y), True, "HRow2_EfficientUp")
+            curr_ln_y = max_lane_idx_y
+            _commit((0, curr_ln_y), True, "VRow1_EfficientLeft")
+            curr_ln_x = 0
+            _commit((curr_ln_x, ex_ln_y), True, "VRow1_ToExit")
+        else:  # Currently at bottom after inner sweeps
+            # Efficient sequence: HRow1(right) → VRow5(up) → HRow2(left) → VRow1(to exit)
+            _commit((max_lane_idx_x, curr_ln_y), True, "HRow1_EfficientRight")
+            curr_ln_x = max_lane_idx_x
+            _commit((curr_ln_x, max_lane_idx_y), True, "VRow5_EfficientUp")
+            curr_ln_y = max_lane_idx_y
+            _commit((0, curr_ln_y), True, "HRow2_EfficientLeft")
+            curr_ln_x = 0
+            _commit((curr_ln_x, ex_ln_y), True, "VRow1_ToExit")
+
+    else:  # BOTTOM-RIGHT corner exit (max_x, 0)
+        if curr_ln_y == max_lane_idx_y:  # Currently at top after inner sweeps
+            # Efficient sequence: HRow1(down) → VRow1(left) → HRow2(up) → VRow5(to exit)
+            _commit((curr_ln_x, 0), True, "HRow1_EfficientDown")
+            curr_ln_y = 0
+            _commit((0, curr_ln_y), True, "VRow1_EfficientLeft")
+            curr_ln_x = 0
+            _commit((curr_ln_x, max_lane_idx_y), True, "HRow2_EfficientUp")
+            curr_ln_y = max_lane_idx_y
+            _commit((max_lane_idx_x, curr_ln_y), True, "VRow5_EfficientRight")
+            curr_ln_x = max_lane_idx_x
+            _commit((curr_ln_x, ex_ln_y), True, "VRow5_ToExit")
+        else:  # Currently at bottom after inner sweeps
+            # Efficient sequence: HRow1(left) → VRow1(up) → HRow2(right) → VRow5(to exit)
+            _commit((0, curr_ln_y), True, "HRow1_EfficientLeft")
+            curr_ln_x = 0
+            _commit((curr_ln_x, max_lane_idx_y), True, "VRow1_EfficientUp")
+            curr_ln_y = max_lane_idx_y
+            _commit((max_lane_idx_x, curr_ln_y), True, "HRow2_EfficientRight")
+            curr_ln_x = max_lane_idx_x
+            _commit((curr_ln_x, ex_ln_y), True, "VRow5_ToExit")
+
+    # Final alignment to exact exit point
+    if curr_ln_x != ex_ln_x or curr_ln_y != ex_ln_y:
+        _commit((ex_ln_x, ex_ln_y), True, "FinalAlignmentToExit")
+
+def _generate_fixed_path_custom(_path, max_lane_idx_x, max_lane_idx_y, exit_point_lanes, gap_size):
+    # Perimeter pass to a non-corner boundary exit, stopping short of it and retracing
+    ex_ln_x, ex_ln_y = exit_point_lanes # Exit point in lane indices
+    curr_ln_x, curr_ln_y = _path.last_point
 
-    if is_corner_exit:
-        if n_inner_x_sweeps > 0:
-            start_sweep_lane_x = last_inner_lane_x if ex_ln_x <= max_lane_idx_x / 2.0 else first_inner_lane_x
-        
-        initial_sweep_dir = -1 if start_sweep_lane_x == last_inner_lane_x else 1
-        end_col_for_range = (first_inner_lane_x -1) if initial_sweep_dir == -1 else (last_inner_lane_x + 1)
-        if n_inner_x_sweeps > 0:
-             lanes_to_sweep_x = list(range(start_sweep_lane_x, end_col_for_range, initial_sweep_dir))
-    else: # Custom Exit - Different starting point based on exit side
-        if n_inner_x_sweeps == 0:
-            start_sweep_lane_x = 0
+    def _commit(new_ln_pt, sow_req, ctx=""):
+        _commit_point_to_path(_path, new_ln_pt, sow_req, ctx)
+
+    # CORRECTED CUSTOM EXIT LOGIC: Stop exactly before exit, then retrace
+
+    if ex_ln_x == max_lane_idx_x:  # RIGHT BOUNDARY EXIT (e.g., 5,2)
+        log.debug("VRow4 ended at (%d, %d), Exit at (%d, %d)", curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y)
+
+        # Step 1: Move unsown directly to exit X-coordinate
+        if curr_ln_x != ex_ln_x:
+            _commit((ex_ln_x, curr_ln_y), False, "CustomExit_MoveToExitColumn")
+            curr_ln_x = ex_ln_x
+            log.debug("Moved to exit column: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Step 2: Calculate position just before exit (with gap) and STOP there
+        if curr_ln_y != ex_ln_y:
+            if ex_ln_y > curr_ln_y:  # Exit is above current position
+                stop_y = ex_ln_y - gap_size if ex_ln_y - gap_size > curr_ln_y else curr_ln_y
+            else:  # Exit is below current position   
+                stop_y = ex_ln_y + gap_size if ex_ln_y + gap_size < curr_ln_y else curr_ln_y
+
+            if stop_y != curr_ln_y:
+                _commit((curr_ln_x, stop_y), False, "CustomExit_StopBeforeExit")
+                curr_ln_y = stop_y
+                log.debug("STOPPED just before exit at: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Step 3: Now retrace back and sow perimeter
+        log.debug("Starting retrace from: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Determine which corner to go to first for retracing
+        if curr_ln_y <= max_lane_idx_y / 2:
+            # Go to bottom-right corner first
+            retrace_corner_y = 0
         else:
-            # Different starting point and direction based on exit side
-            if ex_ln_x == 0:  # LEFT BOUNDARY EXIT - start from VRow4 (rightmost inner)
-                start_sweep_lane_x = last_inner_lane_x  # Start from VRow4
-                if n_inner_x_sweeps == 1:
-                    lanes_to_sweep_x = [start_sweep_lane_x]
-                else:
-                    # REVERSE order: VRow4 → VRow3 → VRow2 → VRow1
-                    lanes_to_sweep_x = list(range(last_inner_lane_x, last_inner_lane_x - n_inner_x_sweeps, -1))
-            elif ex_ln_x == max_lane_idx_x:  # RIGHT BOUNDARY EXIT - start from VRow1 (leftmost inner)
-                start_sweep_lane_x = first_inner_lane_x  # Start from VRow1
-                if n_inner_x_sweeps == 1:
-                    lanes_to_sweep_x = [start_sweep_lane_x]
-                else:
-                    # SEQUENTIAL order: VRow1 → VRow2 → VRow3 → VRow4
-                    lanes_to_sweep_x = list(range(first_inner_lane_x, first_inner_lane_x + n_inner_x_sweeps))
-            elif ex_ln_y == max_lane_idx_y or ex_ln_y == 0:  # TOP or BOTTOM BOUNDARY EXIT
-                if ex_ln_x <= max_lane_idx_x / 2:  # Exit is on left half
-                    # Start from VRow3 (rightmost/FARTHEST) and work leftward: VRow3 → VRow2 → VRow1
-                    start_sweep_lane_x = last_inner_lane_x  # Start from farthest VRow
-                    if n_inner_x_sweeps == 1:
-                        lanes_to_sweep_x = [start_sweep_lane_x]
-                    else:
-                        lanes_to_sweep_x = list(range(last_inner_lane_x, last_inner_lane_x - n_inner_x_sweeps, -1))
-                else:  # Exit is on right half  
-                    # Start from VRow1 (leftmost/FARTHEST) and work rightward: VRow1 → VRow2 → VRow3
-                    start_sweep_lane_x = first_inner_lane_x  # Start from farthest VRow
-                    if n_inner_x_sweeps == 1:
-                        lanes_to_sweep_x = [start_sweep_lane_x]
-                    else:
-                        lanes_to_sweep_x = list(range(first_inner_lane_x, first_inner_lane_x + n_inner_x_sweeps))
-
-
-    initial_pos_lane_x = start_sweep_lane_x if n_inner_x_sweeps > 0 else (0 if ex_ln_x <= max_lane_idx_x / 2.0 else max_lane_idx_x)
-    _points_lanes.append((initial_pos_lane_x, b_start_lane_y))
-    curr_ln_x, curr_ln_y = initial_pos_lane_x, b_start_lane_y
-
-    # Inner vertical sweeps
-    for i, sweep_ln_x in enumerate(lanes_to_sweep_x):
-        curr_ln_x = sweep_ln_x
-        target_ln_y = 0 if curr_ln_y == max_lane_idx_y else max_lane_idx_y
-        
-        curr_ln_y = _commit_partial_vertical_sweep(_points_lanes, _sow_flags, curr_ln_x, curr_ln_y, target_ln_y, gap_size)
-
-        if i < len(lanes_to_sweep_x) - 1:
-            next_sweep_lane_x = lanes_to_sweep_x[i+1]
-            _commit((next_sweep_lane_x, curr_ln_y), False, f"InnerSweep H-Turn{i+1}")
-            curr_ln_x = next_sweep_lane_x
-
-    # BRANCHING LOGIC
-    # Replace the existing corner exit logic (around lines 280-320) with this:
-
-    if is_corner_exit:
-        # EFFICIENT CORNER EXIT LOGIC - Stop inner sweeps one row earlier and turn RIGHT
-        
-        # Determine efficient perimeter sequence based on exit corner and current position
-        ex_ln_x, ex_ln_y = exit_point_lanes
-        
-        if ex_ln_x == 0 and ex_ln_y == max_lane_idx_y:  # TOP-LEFT corner exit (0, max_y)
-            if curr_ln_y == 0:  # Currently at bottom after inner sweeps
-                # Efficient sequence: HRow2(up) → VRow5(right) → HRow1(down) → VRow1(to exit)
-                _commit((curr_ln_x, max_lane_idx_y), True, "HRow2_EfficientUp")
-                curr_ln_y = max_lane_idx_y
-                _commit((max_lane_idx_x, curr_ln_y), True, "VRow5_EfficientRight") 
-                curr_ln_x = max_lane_idx_x
-                _commit((curr_ln_x, 0), True, "HRow1_EfficientDown")
-                curr_ln_y = 0
-                _commit((0, curr_ln_y), True, "VRow1_EfficientLeft")
-                curr_ln_x = 0
-                _commit((curr_ln_x, ex_ln_y), True, "VRow1_ToExit")
-            else:  # Currently at top after inner sweeps
-                # Efficient sequence: HRow2(right) → VRow5(down) → HRow1(left) → VRow1(to exit)
-                _commit((max_lane_idx_x, curr_ln_y), True, "HRow2_EfficientRight")
-                curr_ln_x = max_lane_idx_x
-                _commit((curr_ln_x, 0), True, "VRow5_EfficientDown")
-                curr_ln_y = 0
-                _commit((0, curr_ln_y), True, "HRow1_EfficientLeft")
-                curr_ln_x = 0
-                _commit((curr_ln_x, ex_ln_y), True, "VRow1_ToExit")
-        
-        elif ex_ln_x == max_lane_idx_x and ex_ln_y == max_lane_idx_y:  # TOP-RIGHT corner exit
-            if curr_ln_y == 0:  # Currently at bottom after inner sweeps
-                # Efficient sequence: HRow2(up) → VRow1(left) → HRow1(down) → VRow5(to exit)
-                _commit((curr_ln_x, max_lane_idx_y), True, "HRow2_EfficientUp")
-                curr_ln_y = max_lane_idx_y
-                _commit((0, curr_ln_y), True, "VRow1_EfficientLeft")
-                curr_ln_x = 0
-                _commit((curr_ln_x, 0), True, "HRow1_EfficientDown")
-                curr_ln_y = 0
-                _commit((max_lane_idx_x, curr_ln_y), True, "VRow5_EfficientRight")
-                curr_ln_x = max_lane_idx_x
-                _commit((curr_ln_x, ex_ln_y), True, "VRow5_ToExit")
-            else:  # Currently at top after inner sweeps
-                # Efficient sequence: HRow2(left) → VRow1(down) → HRow1(right) → VRow5(to exit)
-                _commit((0, curr_ln_y), True, "HRow2_EfficientLeft")
-                curr_ln_x = 0
-                _commit((curr_ln_x, 0), True, "VRow1_EfficientDown")
-                curr_ln_y = 0
-                _commit((max_lane_idx_x, curr_ln_y), True, "HRow1_EfficientRight")
-                curr_ln_x = max_lane_idx_x
-                _commit((curr_ln_x, ex_ln_y), True, "VRow5_ToExit")
-        
-        elif ex_ln_x == 0 and ex_ln_y == 0:  # BOTTOM-LEFT corner exit
-            if curr_ln_y == max_lane_idx_y:  # Currently at top after inner sweeps
-                # Efficient sequence: HRow1(down) → VRow5(right) → HRow2(up) → VRow1(to exit)
-                _commit((curr_ln_x, 0), True, "HRow1_EfficientDown")
-                curr_ln_y = 0
-                _commit((max_lane_idx_x, curr_ln_y), True, "VRow5_EfficientRight")
-                curr_ln_x = max_lane_idx_x
-                _commit((curr_ln_x, max_lane_idx_y), True, "HRow2_EfficientUp")
-                curr_ln_y = max_lane_idx_y
-                _commit((0, curr_ln_y), True, "VRow1_EfficientLeft")
-                curr_ln_x = 0
-                _commit((curr_ln_x, ex_ln_y), True, "VRow1_ToExit")
-            else:  # Currently at bottom after inner sweeps
-                # Efficient sequence: HRow1(right) → VRow5(up) → HRow2(left) → VRow1(to exit)
-                _commit((max_lane_idx_x, curr_ln_y), True, "HRow1_EfficientRight")
-                curr_ln_x = max_lane_idx_x
-                _commit((curr_ln_x, max_lane_idx_y), True, "VRow5_EfficientUp")
-                curr_ln_y = max_lane_idx_y
-                _commit((0, curr_ln_y), True, "HRow2_EfficientLeft")
-                curr_ln_x = 0
-                _commit((curr_ln_x, ex_ln_y), True, "VRow1_ToExit")
-        
-        else:  # BOTTOM-RIGHT corner exit (max_x, 0)
-            if curr_ln_y == max_lane_idx_y:  # Currently at top after inner sweeps
-                # Efficient sequence: HRow1(down) → VRow1(left) → HRow2(up) → VRow5(to exit)
-                _commit((curr_ln_x, 0), True, "HRow1_EfficientDown")
-                curr_ln_y = 0
-                _commit((0, curr_ln_y), True, "VRow1_EfficientLeft")
-                curr_ln_x = 0
-                _commit((curr_ln_x, max_lane_idx_y), True, "HRow2_EfficientUp")
-                curr_ln_y = max_lane_idx_y
-                _commit((max_lane_idx_x, curr_ln_y), True, "VRow5_EfficientRight")
-                curr_ln_x = max_lane_idx_x
-                _commit((curr_ln_x, ex_ln_y), True, "VRow5_ToExit")
-            else:  # Currently at bottom after inner sweeps
-                # Efficient sequence: HRow1(left) → VRow1(up) → HRow2(right) → VRow5(to exit)
-                _commit((0, curr_ln_y), True, "HRow1_EfficientLeft")
-                curr_ln_x = 0
-                _commit((curr_ln_x, max_lane_idx_y), True, "VRow1_EfficientUp")
-                curr_ln_y = max_lane_idx_y
-                _commit((max_lane_idx_x, curr_ln_y), True, "HRow2_EfficientRight")
-                curr_ln_x = max_lane_idx_x
-                _commit((curr_ln_x, ex_ln_y), True, "VRow5_ToExit")
-        
-        # Final alignment to exact exit point
-        if curr_ln_x != ex_ln_x or curr_ln_y != ex_ln_y:
-            _commit((ex_ln_x, ex_ln_y), True, "FinalAlignmentToExit")
+            # Go to top-right corner first   
+            retrace_corner_y = max_lane_idx_y
 
-
-
-
-    
-    else:
-        # CORRECTED CUSTOM EXIT LOGIC: Stop exactly before exit, then retrace
-        
-        if ex_ln_x == max_lane_idx_x:  # RIGHT BOUNDARY EXIT (e.g., 5,2)
-            print(f"DEBUG: VRow4 ended at ({curr_ln_x}, {curr_ln_y}), Exit at ({ex_ln_x}, {ex_ln_y})")
-            
-            # Step 1: Move unsown directly to exit X-coordinate
-            if curr_ln_x != ex_ln_x:
-                _commit((ex_ln_x, curr_ln_y), False, "CustomExit_MoveToExitColumn")
-                curr_ln_x = ex_ln_x
-                print(f"DEBUG: Moved to exit column: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Step 2: Calculate position just before exit (with gap) and STOP there
-            if curr_ln_y != ex_ln_y:
-                if ex_ln_y > curr_ln_y:  # Exit is above current position
-                    stop_y = max(curr_ln_y, ex_ln_y - gap_size)
-                else:  # Exit is below current position   
-                    stop_y = min(curr_ln_y, ex_ln_y + gap_size)
-                
-                if stop_y != curr_ln_y:
-                    _commit((curr_ln_x, stop_y), False, "CustomExit_StopBeforeExit")
-                    curr_ln_y = stop_y
-                    print(f"DEBUG: STOPPED just before exit at: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Step 3: Now retrace back and sow perimeter
-            print(f"DEBUG: Starting retrace from: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Determine which corner to go to first for retracing
-            if curr_ln_y <= max_lane_idx_y / 2:
-                # Go to bottom-right corner first
-                retrace_corner_y = 0
-            else:
-                # Go to top-right corner first   
-                retrace_corner_y = max_lane_idx_y
-            
-            # Retrace: Sow vertically to corner
-            if curr_ln_y != retrace_corner_y:
-                curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                    curr_ln_x, curr_ln_y, curr_ln_x, retrace_corner_y,
-                    exit_point_lanes, _points_lanes, _sow_flags,
-                    "CustomExit_RetraceToCorner", gap_size=gap_size)
-                print(f"DEBUG: Retraced to corner: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow horizontal to left boundary
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, 0, curr_ln_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowHorizontalToLeft", gap_size=gap_size)
-            print(f"DEBUG: Sowed to left boundary: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow vertical to opposite corner
-            opposite_corner_y = max_lane_idx_y if retrace_corner_y == 0 else 0
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, curr_ln_x, opposite_corner_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowVerticalToOpposite", gap_size=gap_size)
-            print(f"DEBUG: Sowed to opposite corner: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow horizontal back to right boundary
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, max_lane_idx_x, curr_ln_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowHorizontalToRight", gap_size=gap_size)
-            print(f"DEBUG: Sowed back to right boundary: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Final sowing approach to actual exit
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_FinalSowToExit", gap_size=gap_size)
-            print(f"DEBUG: Final approach to exit: ({curr_ln_x}, {curr_ln_y})")
-              
-        elif ex_ln_x == 0:  # LEFT BOUNDARY EXIT (opposite of right boundary)
-            print(f"DEBUG: VRow4 ended at ({curr_ln_x}, {curr_ln_y}), Exit at ({ex_ln_x}, {ex_ln_y})")
-            
-            # Step 1: Move unsown directly to exit X-coordinate (left boundary = 0)
-            if curr_ln_x != ex_ln_x:
-                _commit((ex_ln_x, curr_ln_y), False, "CustomExit_MoveToExitColumn")
-                curr_ln_x = ex_ln_x
-                print(f"DEBUG: Moved to exit column: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Step 2: Calculate position just before exit (with gap) and STOP there
-            if curr_ln_y != ex_ln_y:
-                if ex_ln_y > curr_ln_y:  # Exit is above current position
-                    stop_y = max(curr_ln_y, ex_ln_y - gap_size)
-                else:  # Exit is below current position
-                    stop_y = min(curr_ln_y, ex_ln_y + gap_size)
-                
-                if stop_y != curr_ln_y:
-                    _commit((curr_ln_x, stop_y), False, "CustomExit_StopBeforeExit")
-                    curr_ln_y = stop_y
-                    print(f"DEBUG: STOPPED just before exit at: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Step 3: Now retrace back and sow perimeter (OPPOSITE direction of right boundary)
-            print(f"DEBUG: Starting retrace from: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Determine which corner to go to first for retracing (same logic as right)
-            if curr_ln_y <= max_lane_idx_y / 2:
-                retrace_corner_y = 0  # Go to bottom-left corner first
-            else:
-                retrace_corner_y = max_lane_idx_y  # Go to top-left corner first
-            
-            # Retrace: Sow vertically to corner (LEFT boundary vertical)
-            if curr_ln_y != retrace_corner_y:
-                curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                    curr_ln_x, curr_ln_y, curr_ln_x, retrace_corner_y,
-                    exit_point_lanes, _points_lanes, _sow_flags,
-                    "CustomExit_RetraceToCorner", gap_size=gap_size)
-                print(f"DEBUG: Retraced to corner: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow horizontal to RIGHT boundary (OPPOSITE of right boundary logic)
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, max_lane_idx_x, curr_ln_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowHorizontalToRight", gap_size=gap_size)
-            print(f"DEBUG: Sowed to right boundary: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow vertical to opposite corner
-            opposite_corner_y = max_lane_idx_y if retrace_corner_y == 0 else 0
+        # Retrace: Sow vertically to corner
+        if curr_ln_y != retrace_corner_y:
             curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, curr_ln_x, opposite_corner_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowVerticalToOpposite", gap_size=gap_size)
-            print(f"DEBUG: Sowed to opposite corner: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow horizontal back to LEFT boundary (OPPOSITE - back to exit side)
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, 0, curr_ln_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowHorizontalToLeft", gap_size=gap_size)
-            print(f"DEBUG: Sowed back to left boundary: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Final sowing approach to actual exit
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_FinalSowToExit", gap_size=gap_size)
-            print(f"DEBUG: Final approach to exit: ({curr_ln_x}, {curr_ln_y})")
-              
-        elif ex_ln_y == max_lane_idx_y:  # TOP BOUNDARY EXIT
-            print(f"DEBUG: VRow4 ended at ({curr_ln_x}, {curr_ln_y}), Exit at ({ex_ln_x}, {ex_ln_y})")
-            
-            # Step 1: Move unsown directly to exit Y-coordinate (positioning only)
-            if curr_ln_y != ex_ln_y:
-                _commit((curr_ln_x, ex_ln_y), False, "CustomExit_MoveToExitRow")
-                curr_ln_y = ex_ln_y
-                print(f"DEBUG: Moved to exit row: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Step 2: Calculate position just before exit (with gap) and STOP there (positioning only)
-            if curr_ln_x != ex_ln_x:
-                if ex_ln_x > curr_ln_x:  # Exit is to the right
-                    stop_x = max(curr_ln_x, ex_ln_x - gap_size)
-                else:  # Exit is to the left
-                    stop_x = min(curr_ln_x, ex_ln_x + gap_size)
-                
-                if stop_x != curr_ln_x:
-                    _commit((stop_x, curr_ln_y), False, "CustomExit_StopBeforeExit")
-                    curr_ln_x = stop_x
-                    print(f"DEBUG: STOPPED just before exit at: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Step 3: Now retrace back and sow perimeter (INCLUDING FARTHEST BOUNDARY)
-            print(f"DEBUG: Starting retrace from: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Determine which corner to go to first for retracing
-            if curr_ln_x <= max_lane_idx_x / 2:
-                retrace_corner_x = 0  # Go to top-left corner first
-                farthest_boundary_x = max_lane_idx_x  # Farthest is right boundary
-            else:
-                retrace_corner_x = max_lane_idx_x  # Go to top-right corner first
-                farthest_boundary_x = 0  # Farthest is left boundary
-            
-            # Retrace: Sow horizontally to corner
-            if curr_ln_x != retrace_corner_x:
-                curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                    curr_ln_x, curr_ln_y, retrace_corner_x, curr_ln_y,
-                    exit_point_lanes, _points_lanes, _sow_flags,
-                    "CustomExit_RetraceToCorner", gap_size=gap_size)
-                print(f"DEBUG: Retraced to corner: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow vertical to bottom boundary (FARTHEST HORIZONTAL BOUNDARY)
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, curr_ln_x, 0,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowVerticalToFarthestBoundary", gap_size=gap_size)
-            print(f"DEBUG: Sowed to farthest boundary (bottom): ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow horizontal to opposite corner (completing farthest boundary)
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, farthest_boundary_x, curr_ln_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowFarthestBoundaryHorizontal", gap_size=gap_size)
-            print(f"DEBUG: Sowed farthest boundary horizontal: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow vertical back to top boundary
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, curr_ln_x, max_lane_idx_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowVerticalBackToTop", gap_size=gap_size)
-            print(f"DEBUG: Sowed back to top boundary: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Final sowing approach to actual exit
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_FinalSowToExit", gap_size=gap_size)
-            print(f"DEBUG: Final approach to exit: ({curr_ln_x}, {curr_ln_y})")
+                curr_ln_x, curr_ln_y, curr_ln_x, retrace_corner_y,
+                exit_point_lanes, _path,
+                "CustomExit_RetraceToCorner", gap_size=gap_size)
+            log.debug("Retraced to corner: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow horizontal to left boundary
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, 0, curr_ln_y,
+            exit_point_lanes, _path,
+            "CustomExit_SowHorizontalToLeft", gap_size=gap_size)
+        log.debug("Sowed to left boundary: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow vertical to opposite corner
+        opposite_corner_y = max_lane_idx_y if retrace_corner_y == 0 else 0
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, curr_ln_x, opposite_corner_y,
+            exit_point_lanes, _path,
+            "CustomExit_SowVerticalToOpposite", gap_size=gap_size)
+        log.debug("Sowed to opposite corner: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow horizontal back to right boundary
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, max_lane_idx_x, curr_ln_y,
+            exit_point_lanes, _path,
+            "CustomExit_SowHorizontalToRight", gap_size=gap_size)
+        log.debug("Sowed back to right boundary: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Final sowing approach to actual exit
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y,
+            exit_point_lanes, _path,
+            "CustomExit_FinalSowToExit", gap_size=gap_size)
+        log.debug("Final approach to exit: (%d, %d)", curr_ln_x, curr_ln_y)
+
+    elif ex_ln_x == 0:  # LEFT BOUNDARY EXIT (opposite of right boundary)
+        log.debug("VRow4 ended at (%d, %d), Exit at (%d, %d)", curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y)
+
+        # Step 1: Move unsown directly to exit X-coordinate (left boundary = 0)
+        if curr_ln_x != ex_ln_x:
+            _commit((ex_ln_x, curr_ln_y), False, "CustomExit_MoveToExitColumn")
+            curr_ln_x = ex_ln_x
+            log.debug("Moved to exit column: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Step 2: Calculate position just before exit (with gap) and STOP there
+        if curr_ln_y != ex_ln_y:
+            if ex_ln_y > curr_ln_y:  # Exit is above current position
+                stop_y = ex_ln_y - gap_size if ex_ln_y - gap_size > curr_ln_y else curr_ln_y
+            else:  # Exit is below current position
+                stop_y = ex_ln_y + gap_size if ex_ln_y + gap_size < curr_ln_y else curr_ln_y
+
+            if stop_y != curr_ln_y:
+                _commit((curr_ln_x, stop_y), False, "CustomExit_StopBeforeExit")
+                curr_ln_y = stop_y
+                log.debug("STOPPED just before exit at: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Step 3: Now retrace back and sow perimeter (OPPOSITE direction of right boundary)
+        log.debug("Starting retrace from: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Determine which corner to go to first for retracing (same logic as right)
+        if curr_ln_y <= max_lane_idx_y / 2:
+            retrace_corner_y = 0  # Go to bottom-left corner first
+        else:
+            retrace_corner_y = max_lane_idx_y  # Go to top-left corner first
 
-        else:  # BOTTOM BOUNDARY EXIT (ex_ln_y == 0)
-            print(f"DEBUG: VRow4 ended at ({curr_ln_x}, {curr_ln_y}), Exit at ({ex_ln_x}, {ex_ln_y})")
-            
-            # Step 1: Move unsown directly to exit Y-coordinate (positioning only)
-            if curr_ln_y != ex_ln_y:
-                _commit((curr_ln_x, ex_ln_y), False, "CustomExit_MoveToExitRow")
-                curr_ln_y = ex_ln_y
-                print(f"DEBUG: Moved to exit row: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Step 2: Calculate position just before exit (with gap) and STOP there (positioning only)
-            if curr_ln_x != ex_ln_x:
-                if ex_ln_x > curr_ln_x:  # Exit is to the right
-                    stop_x = max(curr_ln_x, ex_ln_x - gap_size)
-                else:  # Exit is to the left
-                    stop_x = min(curr_ln_x, ex_ln_x + gap_size)
-                
-                if stop_x != curr_ln_x:
-                    _commit((stop_x, curr_ln_y), False, "CustomExit_StopBeforeExit")
-                    curr_ln_x = stop_x
-                    print(f"DEBUG: STOPPED just before exit at: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Step 3: Now retrace back and sow perimeter (INCLUDING FARTHEST BOUNDARY)
-            print(f"DEBUG: Starting retrace from: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Determine which corner to go to first for retracing
-            if curr_ln_x <= max_lane_idx_x / 2:
-                retrace_corner_x = 0  # Go to bottom-left corner first
-                farthest_boundary_x = max_lane_idx_x  # Farthest is right boundary
-            else:
-                retrace_corner_x = max_lane_idx_x  # Go to bottom-right corner first
-                farthest_boundary_x = 0  # Farthest is left boundary
-            
-            # Retrace: Sow horizontally to corner
-            if curr_ln_x != retrace_corner_x:
-                curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                    curr_ln_x, curr_ln_y, retrace_corner_x, curr_ln_y,
-                    exit_point_lanes, _points_lanes, _sow_flags,
-                    "CustomExit_RetraceToCorner", gap_size=gap_size)
-                print(f"DEBUG: Retraced to corner: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow vertical to top boundary (FARTHEST HORIZONTAL BOUNDARY)
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, curr_ln_x, max_lane_idx_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowVerticalToFarthestBoundary", gap_size=gap_size)
-            print(f"DEBUG: Sowed to farthest boundary (top): ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow horizontal to opposite corner (completing farthest boundary)
+        # Retrace: Sow vertically to corner (LEFT boundary vertical)
+        if curr_ln_y != retrace_corner_y:
             curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, farthest_boundary_x, curr_ln_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowFarthestBoundaryHorizontal", gap_size=gap_size)
-            print(f"DEBUG: Sowed farthest boundary horizontal: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Sow vertical back to bottom boundary
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, curr_ln_x, 0,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_SowVerticalBackToBottom", gap_size=gap_size)
-            print(f"DEBUG: Sowed back to bottom boundary: ({curr_ln_x}, {curr_ln_y})")
-            
-            # Final sowing approach to actual exit
-            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
-                curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y,
-                exit_point_lanes, _points_lanes, _sow_flags,
-                "CustomExit_FinalSowToExit", gap_size=gap_size)
-            print(f"DEBUG: Final approach to exit: ({curr_ln_x}, {curr_ln_y})")
+                curr_ln_x, curr_ln_y, curr_ln_x, retrace_corner_y,
+                exit_point_lanes, _path,
+                "CustomExit_RetraceToCorner", gap_size=gap_size)
+            log.debug("Retraced to corner: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow horizontal to RIGHT boundary (OPPOSITE of right boundary logic)
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, max_lane_idx_x, curr_ln_y,
+            exit_point_lanes, _path,
+            "CustomExit_SowHorizontalToRight", gap_size=gap_size)
+        log.debug("Sowed to right boundary: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow vertical to opposite corner
+        opposite_corner_y = max_lane_idx_y if retrace_corner_y == 0 else 0
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, curr_ln_x, opposite_corner_y,
+            exit_point_lanes, _path,
+            "CustomExit_SowVerticalToOpposite", gap_size=gap_size)
+        log.debug("Sowed to opposite corner: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow horizontal back to LEFT boundary (OPPOSITE - back to exit side)
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, 0, curr_ln_y,
+            exit_point_lanes, _path,
+            "CustomExit_SowHorizontalToLeft", gap_size=gap_size)
+        log.debug("Sowed back to left boundary: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Final sowing approach to actual exit
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y,
+            exit_point_lanes, _path,
+            "CustomExit_FinalSowToExit", gap_size=gap_size)
+        log.debug("Final approach to exit: (%d, %d)", curr_ln_x, curr_ln_y)
+
+    elif ex_ln_y == max_lane_idx_y:  # TOP BOUNDARY EXIT
+        log.debug("VRow4 ended at (%d, %d), Exit at (%d, %d)", curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y)
+
+        # Step 1: Move unsown directly to exit Y-coordinate (positioning only)
+        if curr_ln_y != ex_ln_y:
+            _commit((curr_ln_x, ex_ln_y), False, "CustomExit_MoveToExitRow")
+            curr_ln_y = ex_ln_y
+            log.debug("Moved to exit row: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Step 2: Calculate position just before exit (with gap) and STOP there (positioning only)
+        if curr_ln_x != ex_ln_x:
+            if ex_ln_x > curr_ln_x:  # Exit is to the right
+                stop_x = ex_ln_x - gap_size if ex_ln_x - gap_size > curr_ln_x else curr_ln_x
+            else:  # Exit is to the left
+                stop_x = ex_ln_x + gap_size if ex_ln_x + gap_size < curr_ln_x else curr_ln_x
+
+            if stop_x != curr_ln_x:
+                _commit((stop_x, curr_ln_y), False, "CustomExit_StopBeforeExit")
+                curr_ln_x = stop_x
+                log.debug("STOPPED just before exit at: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Step 3: Now retrace back and sow perimeter (INCLUDING FARTHEST BOUNDARY)
+        log.debug("Starting retrace from: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Determine which corner to go to first for retracing
+        if curr_ln_x <= max_lane_idx_x / 2:
+            retrace_corner_x = 0  # Go to top-left corner first
+            farthest_boundary_x = max_lane_idx_x  # Farthest is right boundary
+        else:
+            retrace_corner_x = max_lane_idx_x  # Go to top-right corner first
+            farthest_boundary_x = 0  # Farthest is left boundary
 
+        # Retrace: Sow horizontally to corner
+        if curr_ln_x != retrace_corner_x:
+            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+                curr_ln_x, curr_ln_y, retrace_corner_x, curr_ln_y,
+                exit_point_lanes, _path,
+                "CustomExit_RetraceToCorner", gap_size=gap_size)
+            log.debug("Retraced to corner: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow vertical to bottom boundary (FARTHEST HORIZONTAL BOUNDARY)
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, curr_ln_x, 0,
+            exit_point_lanes, _path,
+            "CustomExit_SowVerticalToFarthestBoundary", gap_size=gap_size)
+        log.debug("Sowed to farthest boundary (bottom): (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow horizontal to opposite corner (completing farthest boundary)
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, farthest_boundary_x, curr_ln_y,
+            exit_point_lanes, _path,
+            "CustomExit_SowFarthestBoundaryHorizontal", gap_size=gap_size)
+        log.debug("Sowed farthest boundary horizontal: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow vertical back to top boundary
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, curr_ln_x, max_lane_idx_y,
+            exit_point_lanes, _path,
+            "CustomExit_SowVerticalBackToTop", gap_size=gap_size)
+        log.debug("Sowed back to top boundary: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Final sowing approach to actual exit
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y,
+            exit_point_lanes, _path,
+            "CustomExit_FinalSowToExit", gap_size=gap_size)
+        log.debug("Final approach to exit: (%d, %d)", curr_ln_x, curr_ln_y)
+
+    else:  # BOTTOM BOUNDARY EXIT (ex_ln_y == 0)
+        log.debug("VRow4 ended at (%d, %d), Exit at (%d, %d)", curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y)
+
+        # Step 1: Move unsown directly to exit Y-coordinate (positioning only)
+        if curr_ln_y != ex_ln_y:
+            _commit((curr_ln_x, ex_ln_y), False, "CustomExit_MoveToExitRow")
+            curr_ln_y = ex_ln_y
+            log.debug("Moved to exit row: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Step 2: Calculate position just before exit (with gap) and STOP there (positioning only)
+        if curr_ln_x != ex_ln_x:
+            if ex_ln_x > curr_ln_x:  # Exit is to the right
+                stop_x = ex_ln_x - gap_size if ex_ln_x - gap_size > curr_ln_x else curr_ln_x
+            else:  # Exit is to the left
+                stop_x = ex_ln_x + gap_size if ex_ln_x + gap_size < curr_ln_x else curr_ln_x
+
+            if stop_x != curr_ln_x:
+                _commit((stop_x, curr_ln_y), False, "CustomExit_StopBeforeExit")
+                curr_ln_x = stop_x
+                log.debug("STOPPED just before exit at: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Step 3: Now retrace back and sow perimeter (INCLUDING FARTHEST BOUNDARY)
+        log.debug("Starting retrace from: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Determine which corner to go to first for retracing
+        if curr_ln_x <= max_lane_idx_x / 2:
+            retrace_corner_x = 0  # Go to bottom-left corner first
+            farthest_boundary_x = max_lane_idx_x  # Farthest is right boundary
+        else:
+            retrace_corner_x = max_lane_idx_x  # Go to bottom-right corner first
+            farthest_boundary_x = 0  # Farthest is left boundary
 
+        # Retrace: Sow horizontally to corner
+        if curr_ln_x != retrace_corner_x:
+            curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+                curr_ln_x, curr_ln_y, retrace_corner_x, curr_ln_y,
+                exit_point_lanes, _path,
+                "CustomExit_RetraceToCorner", gap_size=gap_size)
+            log.debug("Retraced to corner: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow vertical to top boundary (FARTHEST HORIZONTAL BOUNDARY)
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, curr_ln_x, max_lane_idx_y,
+            exit_point_lanes, _path,
+            "CustomExit_SowVerticalToFarthestBoundary", gap_size=gap_size)
+        log.debug("Sowed to farthest boundary (top): (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow horizontal to opposite corner (completing farthest boundary)
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, farthest_boundary_x, curr_ln_y,
+            exit_point_lanes, _path,
+            "CustomExit_SowFarthestBoundaryHorizontal", gap_size=gap_size)
+        log.debug("Sowed farthest boundary horizontal: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Sow vertical back to bottom boundary
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, curr_ln_x, 0,
+            exit_point_lanes, _path,
+            "CustomExit_SowVerticalBackToBottom", gap_size=gap_size)
+        log.debug("Sowed back to bottom boundary: (%d, %d)", curr_ln_x, curr_ln_y)
+
+        # Final sowing approach to actual exit
+        curr_ln_x, curr_ln_y = _add_headland_segment_custom_exit_with_gaps(
+            curr_ln_x, curr_ln_y, ex_ln_x, ex_ln_y,
+            exit_point_lanes, _path,
+            "CustomExit_FinalSowToExit", gap_size=gap_size)
+        log.debug("Final approach to exit: (%d, %d)", curr_ln_x, curr_ln_y)
+
+    # Ensure we end exactly at exit point
+    last_ln_x, last_ln_y = _path.last_point
+    if last_ln_x != ex_ln_x:
+        _commit((ex_ln_x, last_ln_y), True, "CustomExit_FinalNav_AlignX")
+    if last_ln_y != ex_ln_y:
+        _commit((ex_ln_x, ex_ln_y), True, "CustomExit_FinalNav_AlignY_to_Exit")
 
+def generate_fixed_path(n_inner_x_sweeps, max_lane_idx_x, max_lane_idx_y, exit_point_lanes, is_corner_exit, gap_size=1):
+    global SOWN_SEGMENTS_LOG
+    SOWN_SEGMENTS_LOG.clear()
 
-        
-        # Ensure we end exactly at exit point
-        if not _points_lanes or _points_lanes[-1] != exit_point_lanes:
-            last_path_pt_ln = _points_lanes[-1]
-            if last_path_pt_ln[0] != ex_ln_x:
-                _commit((ex_ln_x, last_path_pt_ln[1]), True, "CustomExit_FinalNav_AlignX")
-            if _points_lanes[-1] != exit_point_lanes:
-                _commit((ex_ln_x, ex_ln_y), True, "CustomExit_FinalNav_AlignY_to_Exit")
-            
+    _path = _generate_inner_sweep_path(n_inner_x_sweeps, max_lane_idx_x, max_lane_idx_y, exit_point_lanes, is_corner_exit, gap_size)
+    if is_corner_exit:
+        _generate_fixed_path_corner(_path, max_lane_idx_x, max_lane_idx_y, exit_point_lanes)
+    else:
+        _generate_fixed_path_custom(_path, max_lane_idx_x, max_lane_idx_y, exit_point_lanes, gap_size)
+    # (N, 2) int32 lane points and (N-1,) bool sow flags
+    _points_lanes, _sow_flags = _path.to_arrays()
     return {'points_lanes': _points_lanes, 'sow_flags': _sow_flags}
 
 # --- Path Analysis (operates on lane indices) ---
 def analyze_path_sequence_fixed(path_lanes_list, n_inner_x_sweeps_val, max_lx_idx_val, max_ly_idx_val, sow_flags_list):
-    if not path_lanes_list or len(path_lanes_list) < 2: return []
+    if path_lanes_list is None or len(path_lanes_list) < 2: return []
     
     row_sequence = []
-    v_counter = 1; h_counter = 1
-    labeled_v_lanes = set(); labeled_h_lanes = set()  
+    h_counter = 1
+    labeled_h_lanes = set()  
     
-    # FIXED: Create a mapping of lane X positions to VRow numbers
-    # Get all unique X lanes that have vertical sown movements, then sort them
-    all_vertical_lanes = set()
-    for i in range(len(path_lanes_list) - 1):
-        lx1, ly1 = path_lanes_list[i]; lx2, ly2 = path_lanes_list[i+1]
-        is_sown = i < len(sow_flags_list) and sow_flags_list[i]
-        if lx1 == lx2 and ly1 != ly2 and is_sown:  # Vertical sown movement
-            all_vertical_lanes.add(lx1)
+    # Per-segment movement class and sow flag, computed over the whole path at once
+    path_lanes_arr = np.asarray(path_lanes_list, dtype=np.int64)
+    n_segs = len(path_lanes_arr) - 1
+    seg_sown = np.zeros(n_segs, dtype=bool)
+    n_flags = min(len(sow_flags_list), n_segs); seg_sown[:n_flags] = sow_flags_list[:n_flags]
+    seg_dx = path_lanes_arr[1:, 0] - path_lanes_arr[:-1, 0]; seg_dy = path_lanes_arr[1:, 1] - path_lanes_arr[:-1, 1]
+    seg_is_v = (seg_dx == 0) & (seg_dy != 0); seg_is_h = (seg_dy == 0) & (seg_dx != 0)
+    seg_on_headland = (path_lanes_arr[:-1, 1] == 0) | (path_lanes_arr[:-1, 1] == max_ly_idx_val)
     
-    # Sort the lanes and create a mapping: lane_x -> VRow_number
-    sorted_vertical_lanes = sorted(all_vertical_lanes)
+    # FIXED: Create a mapping of lane X positions to VRow numbers
+    # Unique X lanes that have vertical sown movements (np.unique sorts them)
+    sorted_vertical_lanes = np.unique(path_lanes_arr[:-1, 0][seg_is_v & seg_sown]).tolist()
     lane_to_vrow_mapping = {lane_x: f"VRow{idx+1}" for idx, lane_x in enumerate(sorted_vertical_lanes)}
 
-    for i in range(len(path_lanes_list) - 1):
-        lx1, ly1 = path_lanes_list[i]; lx2, ly2 = path_lanes_list[i+1]
-        is_sown = i < len(sow_flags_list) and sow_flags_list[i]
+    path_lanes_py = list(map(tuple, path_lanes_arr.tolist()))
+    for i, is_sown, is_v, is_h, on_headland in zip(range(n_segs), seg_sown.tolist(), seg_is_v.tolist(), seg_is_h.tolist(), seg_on_headland.tolist()):
+        (lx1, ly1), (lx2, ly2) = path_lanes_py[i], path_lanes_py[i+1]
         label = ""; mov_type = "Other"
         
-        if lx1 == lx2 and ly1 != ly2: 
+        if is_v: 
             mov_type = "VRow_Path" 
             # Use the mapping to get correct VRow label
-            if is_sown and lx1 in lane_to_vrow_mapping:
-                label = lane_to_vrow_mapping[lx1]
+            if is_sown:
+                label = lane_to_vrow_mapping.get(lx1, "")
                 
-        elif ly1 == ly2 and lx1 != lx2: 
+        elif is_h: 
             mov_type = "HRow_Path"
-            if is_sown and (ly1 == 0 or ly1 == max_ly_idx_val) and ly1 not in labeled_h_lanes:
-                label = f"HRow{h_counter}"; labeled_h_lanes.add(ly1); h_counter += 1
-            elif is_sown: 
-                label = f"H-Turn{i+1}" 
+            if is_sown:
+                if on_headland and ly1 not in labeled_h_lanes:
+                    label = f"HRow{h_counter}"; labeled_h_lanes.add(ly1); h_counter += 1
+                else: 
+                    label = f"H-Turn{i+1}" 
                     
         row_sequence.append({'segment_path_index': i, 'movement_type': mov_type, 
                              'from_pos_lanes': (lx1, ly1), 'to_pos_lanes': (lx2, ly2),
                              'label': label, 'is_sown': is_sown})
     return row_sequence
 
-def get_movement_analysis(path_lanes_list, seg_idx, max_lx_idx_val, max_ly_idx_val, analyzed_row_seq, sow_flags_all, rover_width_m_val, rover_length_m_val):
-    if seg_idx >= len(path_lanes_list) - 1 or seg_idx >= len(sow_flags_all): return None 
-    
-    lx1, ly1 = path_lanes_list[seg_idx]; lx2, ly2 = path_lanes_list[seg_idx+1]
-
-    # FIXED: Use correct dimensions for lane center calculation
-    from_pos_m_center = ((lx1 + 0.5) * rover_width_m_val, (ly1 + 0.5) * rover_length_m_val)
-    to_pos_m_center = ((lx2 + 0.5) * rover_width_m_val, (ly2 + 0.5) * rover_length_m_val)
-
-    # FIXED: Use correct dimensions for distance calculation
-    distance_m = abs(lx2 - lx1) * rover_width_m_val + abs(ly2 - ly1) * rover_length_m_val
-    
-    row_info = next((rs for rs in analyzed_row_seq if rs['segment_path_index'] == seg_idx), None)
-    label = row_info['label'] if row_info and row_info['label'] else f"Segment{seg_idx + 1}" 
-    
-    analysis = {'from_pos_m': from_pos_m_center, 'to_pos_m': to_pos_m_center,
-                'from_row_y_coord_m': from_pos_m_center[1], 'to_row_y_coord_m': to_pos_m_center[1],
-                'distance_m': distance_m, 'direction': '', 'action': '', 
-                'farming_type': '', 'status': '', 'row_sequence_label': label}
-
-    if lx2 > lx1: analysis['direction'] = 'EAST'
-    elif lx2 < lx1: analysis['direction'] = 'WEST'
-    elif ly2 > ly1: analysis['direction'] = 'NORTH'
-    elif ly2 < ly1: analysis['direction'] = 'SOUTH'
-    
-    is_sown = sow_flags_all[seg_idx]
-    first_inner_lx = 1
-    last_inner_lx = max_lx_idx_val - 1
+class _MovementAnalyses:
+    """Movement analysis of every segment, indexable like a list of get_movement_analysis dicts.
+    Numbers and classes are computed as arrays up front; the dict is only built on access."""
+    # (action, farming_type, status) per movement class
+    _CLASSES = (('NAVIGATION_UNSOWN', 'NONE', 'TRAVERSING_NO_SOW'),
+                ('INNER_VERTICAL_FARMING', 'CROP_PLANTING_V', 'SOWING_VERTICALLY'),
+                ('BOUNDARY_VERTICAL_FARMING', 'PERIMETER_SOWING_V', 'SOWING_VERTICALLY'),
+                ('BOUNDARY_HORIZONTAL_FARMING', 'PERIMETER_SOWING_H', 'SOWING_HORIZONTALLY'),
+                ('TRANSITION_SOWING_H', 'TRANSITION_SOWING_H', 'SOWING_HORIZONTALLY'),
+                ('DIAGONAL_SOWING_ERROR', 'ERROR_SOW', 'SOWING_ERROR_PATH'))
+    _DIRECTIONS = ('', 'EAST', 'WEST', 'NORTH', 'SOUTH')
+
+    def __init__(self, path_lanes_list, max_lx_idx_val, max_ly_idx_val, analyzed_row_seq, sow_flags_all, rover_width_m_val, rover_length_m_val,
+                 path_metric_centers=None):
+        lanes = np.asarray(path_lanes_list, dtype=np.int64)
+        n = min(len(lanes) - 1, len(sow_flags_all))
+        lx1, ly1 = lanes[:n, 0], lanes[:n, 1]; lx2, ly2 = lanes[1:n + 1, 0], lanes[1:n + 1, 1]
+        sown = np.asarray(sow_flags_all[:n], dtype=bool)
+        
+        # FIXED: Use correct dimensions for lane center and distance calculation
+        if path_metric_centers is None:
+            path_metric_centers = (lanes + 0.5) * np.array([rover_width_m_val, rover_length_m_val])
+        centers_m = list(map(tuple, path_metric_centers[:n + 1].tolist()))
+        self._from_m, self._to_m = centers_m[:n], centers_m[1:]
+        self._dist_m = (np.abs(lx2 - lx1) * rover_width_m_val + np.abs(ly2 - ly1) * rover_length_m_val).tolist()
+        
+        self._dir = np.select([lx2 > lx1, lx2 < lx1, ly2 > ly1, ly2 < ly1], [1, 2, 3, 4], 0).tolist()
+        is_v = (lx1 == lx2) & (ly1 != ly2); is_h = (ly1 == ly2) & (lx1 != lx2)
+        is_inner = (1 <= lx1) & (lx1 <= max_lx_idx_val - 1)
+        is_headland = (ly1 == 0) | (ly1 == max_ly_idx_val)
+        self._cls = np.select([~sown, is_v & is_inner, is_v, is_h & is_headland, is_h], [0, 1, 2, 3, 4], 5).tolist()
+        # Row labels as analyzed; the SegmentN fallback is only formatted when a segment is read
+        self._labels = [rs['label'] for rs in analyzed_row_seq[:n]]
+        self._labels += [""] * (n - len(self._labels))
+
+    def __len__(self): return len(self._cls)
+
+    def __getitem__(self, seg_idx):
+        from_m, to_m = self._from_m[seg_idx], self._to_m[seg_idx]
+        action, farming_type, status = self._CLASSES[self._cls[seg_idx]]
+        return {'from_pos_m': from_m, 'to_pos_m': to_m,
+                'from_row_y_coord_m': from_m[1], 'to_row_y_coord_m': to_m[1],
+                'distance_m': self._dist_m[seg_idx], 'direction': self._DIRECTIONS[self._dir[seg_idx]], 'action': action, 
+                'farming_type': farming_type, 'status': status, 'row_sequence_label': self._labels[seg_idx] or f"Segment{seg_idx + 1}"}
 
-    if not is_sown:
-        analysis['farming_type'] = 'NONE'; analysis['action'] = 'NAVIGATION_UNSOWN'; analysis['status'] = 'TRAVERSING_NO_SOW'
-    else:
-        if lx1 == lx2 and ly1 != ly2: 
-            analysis['status'] = 'SOWING_VERTICALLY'
-            first_inner_lx = 1
-            last_inner_lx = max_lx_idx_val - 1
-            is_inner_v_sweep = (first_inner_lx <= lx1 <= last_inner_lx)
-            analysis['action'] = 'INNER_VERTICAL_FARMING' if is_inner_v_sweep else 'BOUNDARY_VERTICAL_FARMING'
-            analysis['farming_type'] = 'CROP_PLANTING_V' if is_inner_v_sweep else 'PERIMETER_SOWING_V'
-
-        elif ly1 == ly2 and lx1 != lx2: 
-            analysis['status'] = 'SOWING_HORIZONTALLY'
-            is_headland_h = (ly1 == 0 or ly1 == max_ly_idx_val)
-            analysis['action'] = 'BOUNDARY_HORIZONTAL_FARMING' if is_headland_h else 'TRANSITION_SOWING_H' 
-            analysis['farming_type'] = 'PERIMETER_SOWING_H' if is_headland_h else 'TRANSITION_SOWING_H'
-        else: 
-            analysis['action'] = 'DIAGONAL_SOWING_ERROR'; analysis['farming_type'] = 'ERROR_SOW'; analysis['status'] = 'SOWING_ERROR_PATH'
-    return analysis
+def get_movement_analysis(path_lanes_list, seg_idx, max_lx_idx_val, max_ly_idx_val, analyzed_row_seq, sow_flags_all, rover_width_m_val, rover_length_m_val):
+    # Single-segment view of _MovementAnalyses; callers analysing a whole path should build that once
+    analyses = _MovementAnalyses(path_lanes_list, max_lx_idx_val, max_ly_idx_val, analyzed_row_seq, sow_flags_all, rover_width_m_val, rover_length_m_val)
+    if seg_idx >= len(analyses): return None
+    return analyses[seg_idx]
 
 # --- Telemetry Logger ---
 class LiveTelemetryLogger:
@@ -878,38 +842,67 @@ class LiveTelemetryLogger:
 
 
 # --- Animation ---
-def interpolate_path(path_pts_metric_centers, pts_per_seg=25): 
-    if not path_pts_metric_centers or len(path_pts_metric_centers) < 2: return np.array([]), np.array([])
-    sx_m, sy_m = [], []
-    for i in range(len(path_pts_metric_centers) - 1):
-        x0,y0 = path_pts_metric_centers[i]; x1,y1 = path_pts_metric_centers[i+1]
-        sx_m.extend(np.linspace(x0, x1, pts_per_seg)); sy_m.extend(np.linspace(y0, y1, pts_per_seg))
-    return np.array(sx_m), np.array(sy_m)
+@functools.lru_cache(maxsize=None)
+def _interp_params(pts_per_seg):
+    # Shared, read-only t in [0, 1] for interpolate_path; one array per pts_per_seg
+    t = np.linspace(0.0, 1.0, pts_per_seg)
+    t.setflags(write=False)
+    return t
+
+def interpolate_path(path_pts_metric_centers, pts_per_seg=POINTS_PER_SEGMENT): 
+    # Accepts an (N, 2) array of metric centers (or any sequence of (x, y) pairs)
+    if path_pts_metric_centers is None or len(path_pts_metric_centers) < 2: return np.array([]), np.array([])
+    # Build every segment in one broadcast: (N-1, pts_per_seg, 2) -> flat (N-1)*pts_per_seg rows
+    pts_m = np.asarray(path_pts_metric_centers, dtype=np.float64)
+    starts_m, ends_m = pts_m[:-1], pts_m[1:]
+    t = _interp_params(pts_per_seg)
+    # (1-t)*a + t*b lands exactly on both waypoints at t = 0 and t = 1
+    smooth_m = ((1.0 - t)[None, :, None] * starts_m[:, None, :] + t[None, :, None] * ends_m[:, None, :]).reshape(-1, 2)
+    return smooth_m[:, 0], smooth_m[:, 1]
+
+def _segment_footprints(path_lanes_arr, path_metric_centers, rover_width_m_val, rover_length_m_val):
+    # Rectangle each segment sweeps: the rover footprint stretched from one end center to the other.
+    # Returns (x, y, width, height, is_vertical) arrays, one entry per segment
+    is_vertical = path_lanes_arr[:-1, 0] == path_lanes_arr[1:, 0]  # Exact on integer lane columns
+    x1, y1 = path_metric_centers[:-1, 0], path_metric_centers[:-1, 1]
+    x2, y2 = path_metric_centers[1:, 0], path_metric_centers[1:, 1]
+    rect_x = np.where(is_vertical, x1, np.minimum(x1, x2)) - rover_width_m_val / 2
+    rect_y = np.where(is_vertical, np.minimum(y1, y2), y1) - rover_length_m_val / 2  # FIXED: Use rover_length_m_val
+    rect_w = np.where(is_vertical, rover_width_m_val, np.abs(x2 - x1) + rover_width_m_val)
+    rect_h = np.where(is_vertical, np.abs(y2 - y1) + rover_length_m_val, rover_length_m_val)
+    return rect_x, rect_y, rect_w, rect_h, is_vertical
 
 def animate_robot(n_inner_x_sweeps_val, max_lx_idx_val, max_ly_idx_val, title_suffix_str, 
                   path_lanes_list, sow_flags_all_list, 
                   exit_vis_lanes, farm_w_m_val, farm_b_m_val, rover_width_m_val, rover_length_m_val):
-    if not path_lanes_list or len(path_lanes_list) < 2: print("❌ Anim Err: Path short."); return None
+    if path_lanes_list is None or len(path_lanes_list) < 2: print("❌ Anim Err: Path short."); return None
+    sow_flags_all_list = np.asarray(sow_flags_all_list, dtype=bool)
     if len(sow_flags_all_list) != len(path_lanes_list) -1 : 
         print(f"❌ Anim Err: Mismatch sow_flags ({len(sow_flags_all_list)}) and segments ({len(path_lanes_list)-1}).")
-        sow_flags_all_list.extend([False] * (max(0, len(path_lanes_list) - 1 - len(sow_flags_all_list))))
+        sow_flags_all_list = np.append(sow_flags_all_list, np.zeros(max(0, len(path_lanes_list) - 1 - len(sow_flags_all_list)), dtype=bool))
 
     # FIXED: Use correct dimensions for path metric centers
-    path_metric_centers_list = [((ln_x + 0.5) * rover_width_m_val, (ln_y + 0.5) * rover_length_m_val) for ln_x, ln_y in path_lanes_list]
+    # Lane points and their metric centers, built once and shared by every consumer below
+    path_lanes_arr = np.asarray(path_lanes_list, dtype=np.int64)
+    path_metric_centers = (path_lanes_arr + 0.5) * np.array([rover_width_m_val, rover_length_m_val])
     exit_vis_metric_center = ((exit_vis_lanes[0] + 0.5) * rover_width_m_val, (exit_vis_lanes[1] + 0.5) * rover_length_m_val)
     
     # FIXED: Use the existing analyze_path_sequence_fixed function instead of missing function
-    row_labels_info_list = analyze_path_sequence_fixed(path_lanes_list, n_inner_x_sweeps_val, max_lx_idx_val, max_ly_idx_val, sow_flags_all_list)    
     seg_labels_info_list = analyze_path_sequence_fixed(path_lanes_list, n_inner_x_sweeps_val, max_lx_idx_val, max_ly_idx_val, sow_flags_all_list)
     logger_obj = LiveTelemetryLogger(farm_w_m_val, farm_b_m_val, rover_width_m_val, rover_length_m_val, title_suffix_str)
     
-    smooth_x_m_centers, smooth_y_m_centers = interpolate_path(path_metric_centers_list)
+    smooth_x_m_centers, smooth_y_m_centers = interpolate_path(path_metric_centers)
     if smooth_x_m_centers.size == 0: print("❌ Anim Err: Interpolated path empty."); return None
     
-    # FIXED: Pass rover_length_m_val to get_movement_analysis
-    analyses_metric_list = [get_movement_analysis(path_lanes_list, i, max_lx_idx_val, max_ly_idx_val, seg_labels_info_list, sow_flags_all_list, rover_width_m_val, rover_length_m_val) for i in range(len(path_lanes_list) - 1)]
+    # FIXED: Pass rover_length_m_val to the movement analyses
+    analyses_metric_list = _MovementAnalyses(path_lanes_list, max_lx_idx_val, max_ly_idx_val, seg_labels_info_list, sow_flags_all_list,
+                                             rover_width_m_val, rover_length_m_val, path_metric_centers)
     
     fig, ax = plt.subplots(figsize=(12, 10)); ax.set_aspect('equal')
+    # Blit only on an interactive canvas; file and inline backends render full frames regardless,
+    # and without blitting the moving artists must not be marked animated or they are never drawn
+    backend_name = plt.get_backend().lower()
+    use_blit = backend_name not in NON_INTERACTIVE_BACKENDS and 'inline' not in backend_name
     plot_padding_m = max(rover_width_m_val, rover_length_m_val) * 0.5
     ax.set_xlim(-plot_padding_m, farm_w_m_val + plot_padding_m)
     ax.set_ylim(-plot_padding_m, farm_b_m_val + plot_padding_m)
@@ -920,139 +913,73 @@ def animate_robot(n_inner_x_sweeps_val, max_lx_idx_val, max_ly_idx_val, title_su
     
     # FIXED: Draw row labels with proper positioning using correct dimensions
     # Get unique columns for VRow labels from vertical movements (INCLUDING OUTER LANES)
-    vrow_columns = set()
-
-    for i in range(len(path_lanes_list) - 1):
-        lx1, ly1 = path_lanes_list[i]
-        lx2, ly2 = path_lanes_list[i + 1]
-        is_sown = i < len(sow_flags_all_list) and sow_flags_all_list[i]
-        
-        # Vertical movement in ANY lane that are sown (including outer boundary lanes)
-        if lx1 == lx2 and ly1 != ly2 and is_sown:
-            vrow_columns.add(lx1)
-
+    seg_from_lanes, seg_to_lanes = path_lanes_arr[:-1], path_lanes_arr[1:]
+    seg_sown = np.asarray(sow_flags_all_list[:len(seg_from_lanes)], dtype=bool)
     
-    # Sort columns and assign VRow labels (all on bottom side)
-    sorted_vrow_columns = sorted(vrow_columns)
-    for i, column_x in enumerate(sorted_vrow_columns):
-        tx_m = (column_x + 0.5) * rover_width_m_val
-        ty_m = -plot_padding_m * 0.7  # All VRow labels on bottom side
-        
-        label = f'VRow{i+1}'
-        ax.text(tx_m, ty_m, label, fontsize=10, color='navy', 
-               ha='center', va='center', weight='bold',
-               bbox=dict(boxstyle="round,pad=0.3", fc='lightblue', alpha=0.9, ec='navy', lw=2))
+    # Vertical movement in ANY lane that are sown (including outer boundary lanes)
+    vrow_mask = (seg_from_lanes[:, 0] == seg_to_lanes[:, 0]) & (seg_from_lanes[:, 1] != seg_to_lanes[:, 1]) & seg_sown
+    
+    # Sorted columns (np.unique sorts) and assign VRow labels (all on bottom side)
+    sorted_vrow_columns = np.unique(seg_from_lanes[vrow_mask, 0])
+    vrow_ty_m = -plot_padding_m * 0.7  # All VRow labels on bottom side
+    for i, column_x in enumerate(sorted_vrow_columns.tolist()):
+        ax.text((column_x + 0.5) * rover_width_m_val, vrow_ty_m, f'VRow{i+1}', fontsize=10, color='navy', 
+               ha='center', va='center', weight='bold', bbox=VROW_LABEL_BBOX)
     
     # FIXED: Position HRow labels based on actual horizontal paths in the robot's route
     # Find the Y-coordinates of horizontal movements in the path
-    horizontal_y_positions = set()
-    for i in range(len(path_lanes_list) - 1):
-        x1, y1 = path_lanes_list[i]
-        x2, y2 = path_lanes_list[i + 1]
-        is_sown = i < len(sow_flags_all_list) and sow_flags_all_list[i]
-        
-        if y1 == y2 and x1 != x2 and is_sown:  # Horizontal movement that is sown
-            horizontal_y_positions.add(y1)
+    # Horizontal movement that is sown, same masks as the VRow columns with the axes swapped
+    hrow_mask = (seg_from_lanes[:, 1] == seg_to_lanes[:, 1]) & (seg_from_lanes[:, 0] != seg_to_lanes[:, 0]) & seg_sown
     
-    # Sort horizontal positions and assign labels
-    sorted_horizontal_positions = sorted(horizontal_y_positions)
+    # Sorted rows (np.unique sorts) and assign labels
+    sorted_horizontal_positions = np.unique(seg_from_lanes[hrow_mask, 1]).tolist()
     
-    if len(sorted_horizontal_positions) >= 1:
-        # HRow1 (bottom horizontal path) - positioned on left side
-        hrow1_y_lane = sorted_horizontal_positions[0]
-        hrow1_tx_m = -plot_padding_m * 0.7
-        hrow1_ty_m = (hrow1_y_lane + 0.5) * rover_length_m_val  # FIXED: Use rover_length_m_val
-        ax.text(hrow1_tx_m, hrow1_ty_m, 'HRow1', fontsize=10, color='darkgreen', 
-               ha='center', va='center', weight='bold', rotation=0,
-               bbox=dict(boxstyle="round,pad=0.3", fc='lightgreen', alpha=0.9, ec='darkgreen', lw=2))
+    # HRow1 is the bottom horizontal path, HRow2 the topmost one (if there are two); both on left side
+    hrow_tx_m = -plot_padding_m * 0.7
+    for i, y_lane in enumerate(sorted_horizontal_positions[:1] + sorted_horizontal_positions[1:][-1:]):
+        ax.text(hrow_tx_m, (y_lane + 0.5) * rover_length_m_val, f'HRow{i+1}', fontsize=10, color='darkgreen', 
+               ha='center', va='center', weight='bold', rotation=0, bbox=HROW_LABEL_BBOX)
     
-    if len(sorted_horizontal_positions) >= 2:
-        # HRow2 (top horizontal path) - positioned on left side
-        hrow2_y_lane = sorted_horizontal_positions[-1]  # Last (topmost) horizontal position
-        hrow2_tx_m = -plot_padding_m * 0.7
-        hrow2_ty_m = (hrow2_y_lane + 0.5) * rover_length_m_val  # FIXED: Use rover_length_m_val
-        ax.text(hrow2_tx_m, hrow2_ty_m, 'HRow2', fontsize=10, color='darkgreen', 
-               ha='center', va='center', weight='bold', rotation=0,
-               bbox=dict(boxstyle="round,pad=0.3", fc='lightgreen', alpha=0.9, ec='darkgreen', lw=2))
+    # Per-segment footprint rectangles, shared by the path trace and the sown layer
+    seg_rect_x, seg_rect_y, seg_rect_w, seg_rect_h, seg_vertical = _segment_footprints(path_lanes_arr, path_metric_centers, rover_width_m_val, rover_length_m_val)
+    seg_rects = list(zip(seg_rect_x.tolist(), seg_rect_y.tolist(), seg_rect_w.tolist(), seg_rect_h.tolist()))
+    # Segments heading down (vertical) or left (horizontal) grow their sown rectangle from the far edge
+    seg_reversed = np.where(seg_vertical, seg_to_lanes[:, 1] < seg_from_lanes[:, 1], seg_to_lanes[:, 0] < seg_from_lanes[:, 0]).tolist()
+    seg_vertical = seg_vertical.tolist()
     
     # FIXED: Draw full path trace using rectangles with proper rover dimensions
     single_brown_color = '#8B4513'  # Consistent brown color
-    for i in range(len(path_metric_centers_list) - 1):
-        x1, y1 = path_metric_centers_list[i]
-        x2, y2 = path_metric_centers_list[i + 1]
-        
-        if x1 == x2:  # Vertical movement
-            rect_x = x1 - rover_width_m_val / 2
-            rect_y = min(y1, y2) - rover_length_m_val / 2  # FIXED: Use rover_length_m_val
-            rect_width = rover_width_m_val
-            rect_height = abs(y2 - y1) + rover_length_m_val  # FIXED: Use rover_length_m_val
-        else:  # Horizontal movement
-            rect_x = min(x1, x2) - rover_width_m_val / 2
-            rect_y = y1 - rover_length_m_val / 2
-            rect_width = abs(x2 - x1) + rover_width_m_val
-            rect_height = rover_length_m_val
-        
-        # Add rectangle for full path trace
-        path_rect = Rectangle((rect_x, rect_y), rect_width, rect_height, 
-                            color=single_brown_color, alpha=0.4, zorder=2)
-        ax.add_patch(path_rect)
+    # The trace never changes, so all segments go into one collection (one artist to draw)
+    path_trace = PatchCollection([Rectangle((rect_x, rect_y), rect_width, rect_height) for rect_x, rect_y, rect_width, rect_height in seg_rects],
+                                 facecolor=single_brown_color, edgecolor=single_brown_color, alpha=0.4, zorder=2)
+    ax.add_collection(path_trace, autolim=False)
     
-    # FIXED: Pre-create all sown rectangles with proper rover dimensions
-    sown_rectangles = []
-    sown_progress_masks = []  # To track partial visibility parameters
-    for i in range(len(path_lanes_list) - 1):
-        if sow_flags_all_list[i]:
-            x1, y1 = path_metric_centers_list[i]
-            x2, y2 = path_metric_centers_list[i + 1]
-            
-            if x1 == x2:  # Vertical movement
-                rect_x = x1 - rover_width_m_val / 2
-                rect_y = min(y1, y2) - rover_length_m_val / 2  # FIXED: Use rover_length_m_val
-                rect_width = rover_width_m_val
-                rect_height = abs(y2 - y1) + rover_length_m_val  # FIXED: Use rover_length_m_val
-            else:  # Horizontal movement
-                rect_x = min(x1, x2) - rover_width_m_val / 2
-                rect_y = y1 - rover_length_m_val / 2
-                rect_width = abs(x2 - x1) + rover_width_m_val
-                rect_height = rover_length_m_val
-            
-            # Create a clipping rectangle that will grow gradually
-            # Start with zero size in the movement direction
-            if x1 == x2:  # Vertical - start with zero height
-                clip_rect = Rectangle((rect_x, rect_y), rect_width, 0, 
-                                    color='#006400', alpha=0.8, zorder=3, visible=False)
-            else:  # Horizontal - start with zero width
-                clip_rect = Rectangle((rect_x, rect_y), 0, rect_height, 
-                                    color='#006400', alpha=0.8, zorder=3, visible=False)
-            
-            ax.add_patch(clip_rect)
-            sown_rectangles.append((i, clip_rect))
-            sown_progress_masks.append({
-                'full_width': rect_width, 
-                'full_height': rect_height, 
-                'is_vertical': x1 == x2, 
-                'base_x': rect_x, 
-                'base_y': rect_y,
-                'start_pos': (x1, y1),
-                'end_pos': (x2, y2)
-            })
-        else:
-            sown_rectangles.append((i, None))
-            sown_progress_masks.append(None)
-    
-    # Create dummy lines for legend with rover dimensions info
-    full_path_trace_line, = ax.plot([], [], color=single_brown_color, lw=10, alpha=0.4, label=f'Unsown Path (Rover:{rover_width_m_val}x{rover_length_m_val}m)')
-    sown_segments_line, = ax.plot([], [], color='#006400', lw=10, alpha=0.8, label=f'Sown Area (Rover:{rover_width_m_val}x{rover_length_m_val}m)')
+    # FIXED: Sown area drawn with proper rover dimensions, as two artists added once:
+    # finished sown segments are full footprints in one animated polygon collection, and the one
+    # segment being sown grows a single rectangle.
+    # A blit therefore redraws the rover, this collection and at most the growing rectangle
+    seg_is_sown = np.asarray(sow_flags_all_list[:len(path_lanes_list) - 1], dtype=bool)
+    # Footprint corners of every sown segment, (n_sown, 4, 2), in segment order
+    sown_x0, sown_y0 = seg_rect_x[seg_is_sown], seg_rect_y[seg_is_sown]
+    sown_x1, sown_y1 = sown_x0 + seg_rect_w[seg_is_sown], sown_y0 + seg_rect_h[seg_is_sown]
+    sown_done_verts = np.stack((np.column_stack((sown_x0, sown_y0)), np.column_stack((sown_x1, sown_y0)),
+                                np.column_stack((sown_x1, sown_y1)), np.column_stack((sown_x0, sown_y1))), axis=1)
+    seg_is_sown = seg_is_sown.tolist()
+    sown_done_collection = PolyCollection([], facecolor='#006400', edgecolor='#006400', alpha=0.8, zorder=3, animated=use_blit)
+    ax.add_collection(sown_done_collection, autolim=False)
+    # Growth parameters come straight from seg_rects / seg_vertical / seg_reversed
+    growing_sown_rect = Rectangle((0, 0), 0, 0, color='#006400', alpha=0.8, zorder=3, visible=False, animated=use_blit)
+    ax.add_patch(growing_sown_rect)
     
     # UPDATED: Use actual rover dimensions for visual representation
     rover_body_width_m = rover_width_m_val 
     rover_body_height_m = rover_length_m_val  # Use rover length for visual height
-    initial_rover_center_m = path_metric_centers_list[0]
+    initial_rover_center_m = path_metric_centers[0]
     robot_body_patch = Rectangle((initial_rover_center_m[0] - rover_body_width_m/2, initial_rover_center_m[1] - rover_body_height_m/2), 
-                                 rover_body_width_m, rover_body_height_m, color='orange', ec='black', lw=1.5, zorder=4)
+                                 rover_body_width_m, rover_body_height_m, color='orange', ec='black', lw=1.5, zorder=4, animated=use_blit)
     ax.add_patch(robot_body_patch)
     
-    start_marker_center_m = path_metric_centers_list[0]; marker_radius_m = 0.4 * max(rover_width_m_val, rover_length_m_val)
+    start_marker_center_m = path_metric_centers[0]; marker_radius_m = 0.4 * max(rover_width_m_val, rover_length_m_val)
     ax.add_patch(Circle(start_marker_center_m, marker_radius_m, color='blue', fill=True, lw=2.5, zorder=5, alpha=0.5))
     ax.add_patch(Circle(start_marker_center_m, marker_radius_m, color='blue', fill=False, lw=2.5, zorder=5, hatch='//'))
     
@@ -1063,22 +990,14 @@ def animate_robot(n_inner_x_sweeps_val, max_lx_idx_val, max_ly_idx_val, title_su
     # Determine which border the exit is on and position gate accordingly
     exit_x, exit_y = exit_vis_lanes[0], exit_vis_lanes[1]
     
-    if exit_x == 0:  # Left border
-        gate_x = -gate_height/2
-        gate_y = exit_vis_metric_center[1] - gate_width/2
-        gate_w, gate_h = gate_height, gate_width
-    elif exit_x == max_lx_idx_val:  # Right border
-        gate_x = farm_w_m_val - gate_height/2
-        gate_y = exit_vis_metric_center[1] - gate_width/2
-        gate_w, gate_h = gate_height, gate_width
-    elif exit_y == 0:  # Bottom border
-        gate_x = exit_vis_metric_center[0] - gate_width/2
-        gate_y = -gate_height/2
-        gate_w, gate_h = gate_width, gate_height
-    else:  # Top border
-        gate_x = exit_vis_metric_center[0] - gate_width/2
-        gate_y = farm_b_m_val - gate_height/2
-        gate_w, gate_h = gate_width, gate_height
+    border = 0 if exit_x == 0 else 1 if exit_x == max_lx_idx_val else 2 if exit_y == 0 else 3
+    # (x, y, w, h) per border: left, right, bottom, top; side gates stand upright across the lane
+    gate_x, gate_y, gate_w, gate_h = (
+        (-gate_height/2, exit_vis_metric_center[1] - gate_width/2, gate_height, gate_width),
+        (farm_w_m_val - gate_height/2, exit_vis_metric_center[1] - gate_width/2, gate_height, gate_width),
+        (exit_vis_metric_center[0] - gate_width/2, -gate_height/2, gate_width, gate_height),
+        (exit_vis_metric_center[0] - gate_width/2, farm_b_m_val - gate_height/2, gate_width, gate_height),
+    )[border]
     
     # Add the gate marker
     exit_gate = Rectangle((gate_x, gate_y), gate_w, gate_h, 
@@ -1095,114 +1014,111 @@ def animate_robot(n_inner_x_sweeps_val, max_lx_idx_val, max_ly_idx_val, title_su
     ]
     ax.legend(handles=legend_handles,loc='upper right',bbox_to_anchor=(1.28,1.02),fontsize=8); plt.subplots_adjust(right=0.75)
     
-    logged_segments_indices = set(); logger_obj.mission_finalized = False; total_animation_frames = len(smooth_x_m_centers)
-    num_orig_segments = len(path_metric_centers_list) -1
-    pts_per_orig_segment_approx = total_animation_frames // num_orig_segments if num_orig_segments > 0 else total_animation_frames
-
+    logger_obj.mission_finalized = False; total_animation_frames = len(smooth_x_m_centers)
+    num_orig_segments = len(path_metric_centers) -1
+    num_logged_segments = len(analyses_metric_list)  # Segments with a telemetry analysis
+    logged_flags = np.zeros(num_logged_segments, dtype=bool)  # Segment already sent to the logger
+    pts_per_orig_segment_approx = POINTS_PER_SEGMENT if num_orig_segments > 0 else total_animation_frames
+    # Per-segment sow mask and frame windows, computed once instead of per frame
+    sow_mask = np.asarray(sow_flags_all_list[:num_orig_segments], dtype=bool)
+    seg_start_frames = np.arange(num_orig_segments) * pts_per_orig_segment_approx
+    seg_end_frames = np.minimum(seg_start_frames + pts_per_orig_segment_approx, total_animation_frames)
+    frame_to_segment = np.minimum(np.searchsorted(seg_end_frames, np.arange(total_animation_frames), side='right'),
+                                  max(num_orig_segments - 1, 0))
+    finalized_seg_count = 0  # Segments [0, finalized_seg_count) already drawn at full size
+    # Sown segments finish in segment order, so the collection's paths once segments [0, n) are
+    # done are the prefix sown_done_verts[:sown_done_count[n]]
+    sown_done_count = np.searchsorted(np.flatnonzero(sow_mask), np.arange(num_orig_segments + 1)).tolist()
+    # Rover patch corner for every frame, so each frame is one lookup instead of float math on array scalars
+    robot_corner_xy = list(zip((smooth_x_m_centers - rover_body_width_m / 2).tolist(),
+                               (smooth_y_m_centers - rover_body_height_m / 2).tolist()))
+    # Fraction of its segment each frame has covered, so growing a sown rectangle is one lookup per frame
+    frame_seg_start = seg_start_frames[frame_to_segment]; frame_seg_len = seg_end_frames[frame_to_segment] - frame_seg_start
+    frame_progress = np.clip(np.divide(np.arange(total_animation_frames) - frame_seg_start, frame_seg_len,
+                                       out=np.ones(total_animation_frames), where=frame_seg_len > 0), 0.0, 1.0).tolist()
+    frame_progress[-1] = 1.0  # The last frame shows the final segment fully sown
+    frame_to_segment = frame_to_segment.tolist()
+
+    # Everything drawn above is static and gets baked into the blit background once;
+    # only the rover and the sown layer are animated and redrawn per frame
     def init_animation_func(): 
-        robot_body_patch.set_xy((smooth_x_m_centers[0]-rover_body_width_m/2, smooth_y_m_centers[0]-rover_body_height_m/2))
-        return [robot_body_patch]
+        robot_body_patch.set_xy(robot_corner_xy[0])
+        return [robot_body_patch, sown_done_collection, growing_sown_rect]
     
+    def fold_finished_sown_rects(seg_count):
+        # Segments [finalized_seg_count, seg_count) are done: they give way to full footprints
+        # in the collection and are never touched again
+        nonlocal finalized_seg_count
+        growing_sown_rect.set_visible(False)
+        sown_done_collection.set_verts(sown_done_verts[:sown_done_count[seg_count]])
+        finalized_seg_count = seg_count
+
+    # Artists handed to the blitter, built once per segment instead of per frame: the rover,
+    # the finished-sown collection and, on a sown segment, its growing rectangle
+    idle_artists = [robot_body_patch, sown_done_collection]
+    seg_artists = [idle_artists + [growing_sown_rect] if sown else idle_artists for sown in seg_is_sown]
+
+    last_frame_idx = total_animation_frames - 1
+    prev_segment_idx = -1  # Segment seen on the previous frame; segment-level work runs only when it changes
+
     def update_animation_func(frame_idx):
-        current_x_center_m = smooth_x_m_centers[frame_idx]
-        current_y_center_m = smooth_y_m_centers[frame_idx]
-        robot_body_patch.set_xy((current_x_center_m - rover_body_width_m/2, current_y_center_m - rover_body_height_m/2))
+        nonlocal prev_segment_idx
+        robot_body_patch.set_xy(robot_corner_xy[frame_idx])
         
-        current_original_segment_idx = frame_idx // pts_per_orig_segment_approx if pts_per_orig_segment_approx > 0 else num_orig_segments -1
-        current_original_segment_idx = min(current_original_segment_idx, num_orig_segments - 1) 
-
-        if current_original_segment_idx != -1 and current_original_segment_idx < len(analyses_metric_list) and current_original_segment_idx not in logged_segments_indices:
-            if analyses_metric_list[current_original_segment_idx]:
-                 logger_obj.log_movement(current_original_segment_idx + 1, analyses_metric_list[current_original_segment_idx], datetime.now())
-            logged_segments_indices.add(current_original_segment_idx)
+        current_original_segment_idx = frame_to_segment[frame_idx]
+        frame_artists = seg_artists[current_original_segment_idx]
+
+        if current_original_segment_idx != prev_segment_idx:
+            prev_segment_idx = current_original_segment_idx
+            if current_original_segment_idx < num_logged_segments and not logged_flags[current_original_segment_idx]:
+                if analyses_metric_list[current_original_segment_idx]:
+                     logger_obj.log_movement(current_original_segment_idx + 1, analyses_metric_list[current_original_segment_idx], datetime.now())
+                logged_flags[current_original_segment_idx] = True
+            
+            # Show newly completed segments at full size; earlier ones were folded on a previous frame
+            if current_original_segment_idx > finalized_seg_count:
+                fold_finished_sown_rects(current_original_segment_idx)
+            if seg_is_sown[current_original_segment_idx]:
+                growing_sown_rect.set_visible(True)
         
         # Show sown rectangles gradually as rover moves - FIXED VERSION
-        if current_original_segment_idx >= 0:
-            # Make completed segments fully visible with correct dimensions
-            for i in range(min(current_original_segment_idx, len(sown_rectangles))):
-                if i < len(sown_rectangles) and sown_rectangles[i][1] is not None:
-                    rect = sown_rectangles[i][1]
-                    mask = sown_progress_masks[i]
-                    rect.set_visible(True)
-                
-                    # Set to full dimensions immediately for completed segments
-                    if mask['is_vertical']:
-                        rect.set_height(mask['full_height'])
-                        rect.set_y(mask['base_y'])  # Ensure correct position
-                    else:
-                        rect.set_width(mask['full_width'])
-                        rect.set_x(mask['base_x'])  # Ensure correct position
+        # Gradually show current segment based on rover progress
+        if seg_is_sown[current_original_segment_idx]:
+            current_rect = growing_sown_rect
+            rect_x, rect_y, rect_width, rect_height = seg_rects[current_original_segment_idx]
         
-            # Gradually show current segment based on rover progress
-            if (current_original_segment_idx < len(sown_rectangles) and 
-                sown_rectangles[current_original_segment_idx][1] is not None and
-                current_original_segment_idx < len(sow_flags_all_list) and
-                sow_flags_all_list[current_original_segment_idx]):
-            
-                current_rect = sown_rectangles[current_original_segment_idx][1]
-                current_mask = sown_progress_masks[current_original_segment_idx]
-                current_rect.set_visible(True)
-            
-                # Calculate progress within current segment
-                segment_start_frame = current_original_segment_idx * pts_per_orig_segment_approx
-                frames_in_segment = min(pts_per_orig_segment_approx, total_animation_frames - segment_start_frame)
-                progress_in_segment = (frame_idx - segment_start_frame) / frames_in_segment if frames_in_segment > 0 else 1
-                progress_in_segment = max(0, min(1, progress_in_segment))
-            
-                if current_mask['is_vertical']:
-                    # Vertical movement - grow height gradually
-                    new_height = current_mask['full_height'] * progress_in_segment
-                    current_rect.set_height(new_height)
-                
-                    # Determine growth direction based on start/end positions
-                    start_y, end_y = current_mask['start_pos'][1], current_mask['end_pos'][1]
-                    if end_y < start_y:  # Moving from top to bottom
-                        # Rectangle grows from top, so adjust y position
-                        new_y = current_mask['base_y'] + current_mask['full_height'] - new_height
-                        current_rect.set_y(new_y)
-                    else:  # Moving from bottom to top
-                        # Rectangle grows from bottom, keep base_y
-                        current_rect.set_y(current_mask['base_y'])
-                else:
-                    # Horizontal movement - grow width gradually
-                    new_width = current_mask['full_width'] * progress_in_segment
-                    current_rect.set_width(new_width)
-                
-                    # Determine growth direction based on start/end positions
-                    start_x, end_x = current_mask['start_pos'][0], current_mask['end_pos'][0]
-                    if end_x < start_x:  # Moving from right to left
-                        # Rectangle grows from right, so adjust x position
-                        new_x = current_mask['base_x'] + current_mask['full_width'] - new_width
-                        current_rect.set_x(new_x)
-                    else:  # Moving from left to right
-                        # Rectangle grows from left, keep base_x
-                        current_rect.set_x(current_mask['base_x'])
+            progress_in_segment = frame_progress[frame_idx]
         
-        # Final frame handling - ensure all sown rectangles are properly displayed
-        if frame_idx >= total_animation_frames - 1 and not logger_obj.mission_finalized: 
-            # Make all remaining sown rectangles fully visible with correct dimensions
-            for i, (_, rect) in enumerate(sown_rectangles):
-                if rect is not None:
-                    rect.set_visible(True)
-                    if i < len(sown_progress_masks) and sown_progress_masks[i]:
-                        mask = sown_progress_masks[i]
-                        if mask['is_vertical']:
-                            rect.set_height(mask['full_height'])
-                            rect.set_y(mask['base_y'])
-                        else:
-                            rect.set_width(mask['full_width'])
-                            rect.set_x(mask['base_x'])
-                        
-            for i_log_final_check in range(len(analyses_metric_list)): 
-                if i_log_final_check not in logged_segments_indices and analyses_metric_list[i_log_final_check]: 
-                    logger_obj.log_movement(i_log_final_check+1, analyses_metric_list[i_log_final_check], datetime.now())
-            logger_obj.finalize_mission(path_metric_centers_list[-1]) 
-            logger_obj.mission_finalized = True
+            # One set_bounds per frame instead of separate size and position setters
+            if seg_vertical[current_original_segment_idx]:
+                # Vertical movement - grow height gradually;
+                # moving top to bottom grows from the top edge, otherwise from base_y
+                new_height = rect_height * progress_in_segment
+                current_rect.set_bounds(rect_x, rect_y + rect_height - new_height if seg_reversed[current_original_segment_idx] else rect_y,
+                                        rect_width, new_height)
+            else:
+                # Horizontal movement - grow width gradually;
+                # moving right to left grows from the right edge, otherwise from base_x
+                new_width = rect_width * progress_in_segment
+                current_rect.set_bounds(rect_x + rect_width - new_width if seg_reversed[current_original_segment_idx] else rect_x, rect_y,
+                                        new_width, rect_height)
         
-        return [robot_body_patch] + [rect for _, rect in sown_rectangles if rect is not None and rect.get_visible()]
+        # Last frame closes out the mission; runs under both plt.show() and Animation.save()
+        if frame_idx == last_frame_idx: finalize_animation_mission()
+        
+        return frame_artists
+
+    def finalize_animation_mission():
+        # Log any segment no frame landed on, then close out the mission (once)
+        if logger_obj.mission_finalized: return
+        for i_log_final_check in np.flatnonzero(~logged_flags).tolist(): 
+            if analyses_metric_list[i_log_final_check]: 
+                logger_obj.log_movement(i_log_final_check+1, analyses_metric_list[i_log_final_check], datetime.now())
+        logger_obj.finalize_mission(tuple(path_metric_centers[-1].tolist())) 
+        logger_obj.mission_finalized = True
 
     animation_obj = FuncAnimation(fig, update_animation_func, frames=total_animation_frames, 
-                                  init_func=init_animation_func, blit=True, interval=50, repeat=False)
+                                  init_func=init_animation_func, blit=use_blit, interval=50, repeat=False)
     plt.show()
     return animation_obj
 
@@ -1211,18 +1127,33 @@ def animate_robot(n_inner_x_sweeps_val, max_lx_idx_val, max_ly_idx_val, title_su
 
 
 class LiveTelemetryLogger:
+    # Console block per movement, parsed once; fields come straight from the analysis dict
+    _PRINT_TPL = ("\n⏱️ {ts} [S{step:02d}] (+{el:.1f}s)\n🏷️ {row_sequence_label}\n"
+                  "📍 ({from_pos_m[0]:.1f}, {from_pos_m[1]:.1f}) → ({to_pos_m[0]:.1f}, {to_pos_m[1]:.1f}) (D:{distance_m:.1f}m)\n"
+                  "🧭 Act: {action} ({status}) | Type: {farming_type}\n"
+                  "📊 TD:{td:.1f}m SD:{sd:.1f}m VS:{vs} HS:{hs}\n" + "-" * 70)
+
     def __init__(self, farm_w_m, farm_b_m, rover_width_m, rover_length_m, exit_info_str):
         self.farm_w_m = farm_w_m; self.farm_b_m = farm_b_m; self.rover_width_m = rover_width_m; self.rover_length_m = rover_length_m
         self.sown_v_segs = 0; self.sown_h_segs = 0
         self.total_dist_m = 0; self.total_sow_dist_m = 0
         self.start_time = datetime.now(); self.csv_filename = "navigation_log.csv"
-        if not os.path.exists(self.csv_filename):
+        self._t0 = time.perf_counter()  # Monotonic clock for elapsed times; wall time only for timestamps
+        # One buffered handle for the whole mission instead of an open/close per row
+        self._csv_fh = None; self._csv_writer = None
+        try:
+            # Exclusive create decides "new file?" in the same open call, with no exists() check to race
             try:
-                with open(self.csv_filename, 'w', newline='', encoding='utf-8') as f:
-                    w = csv.writer(f); w.writerow(["Timestamp", "Step", "Label", "From (m)", "To (m)", "FromY (m)", "ToY (m)", "Dir", "Action", "FarmType", "Status", "SegDist (m)", "TotalDist (m)", "SownDist (m)", "V_Sown_Segs", "H_Sown_Segs"])
+                self._csv_fh = open(self.csv_filename, 'x', newline='', encoding='utf-8', buffering=1 << 16); is_new_csv = True
+            except FileExistsError:
+                self._csv_fh = open(self.csv_filename, 'a', newline='', encoding='utf-8', buffering=1 << 16); is_new_csv = False
+            self._csv_writer = csv.writer(self._csv_fh)
+            atexit.register(self._csv_fh.close)  # Buffered rows still reach disk if the mission never finalizes
+            if is_new_csv:
+                self._csv_writer.writerow(TELEMETRY_CSV_HEADER)
                 print(f"💾 CSV created: {self.csv_filename}")
-            except IOError as e: print(f"❌ CSV Error: {e}")
-        else: print(f"📝 Appending to: {self.csv_filename}")
+            else: print(f"📝 Appending to: {self.csv_filename}")
+        except IOError as e: print(f"❌ CSV Error: {e}")
         hdr = "🤖 FARM ROBOT TELEMETRY 🤖"; print(f"\n{hdr}\n{'='*len(hdr)}\n📊 Farm: {farm_w_m}x{farm_b_m}m, Rover: {rover_width_m}x{rover_length_m}m\n🎯 Exit: {exit_info_str}\n⏰ Start: {self.start_time:%Y-%m-%d %H:%M:%S}\n{'='*len(hdr)}\n🔴 LIVE LOG:\n{'='*len(hdr)}")
 
     def log_movement(self, step, analysis, time_now): 
@@ -1232,27 +1163,32 @@ class LiveTelemetryLogger:
             self.total_sow_dist_m += analysis['distance_m']
             if 'VERTICAL' in analysis['action'] or '_V' in analysis['farming_type']: self.sown_v_segs += 1
             elif 'HORIZONTAL' in analysis['action'] or '_H' in analysis['farming_type']: self.sown_h_segs += 1
-        elapsed = (time_now - self.start_time).total_seconds()
+        elapsed = time.perf_counter() - self._t0
         display_label = analysis['row_sequence_label']
-        from_pos_str = f"({analysis['from_pos_m'][0]:.1f}, {analysis['from_pos_m'][1]:.1f})"
-        to_pos_str = f"({analysis['to_pos_m'][0]:.1f}, {analysis['to_pos_m'][1]:.1f})"
-        print(f"\n⏱️ {time_now:%H:%M:%S.%f}"[:-3] + f" [S{step:02d}] (+{elapsed:.1f}s)\n🏷️ {display_label}\n📍 {from_pos_str} → {to_pos_str} (D:{analysis['distance_m']:.1f}m)\n🧭 Act: {analysis['action']} ({analysis['status']}) | Type: {analysis['farming_type']}\n📊 TD:{self.total_dist_m:.1f}m SD:{self.total_sow_dist_m:.1f}m VS:{self.sown_v_segs} HS:{self.sown_h_segs}\n{'-'*70}")
-        row = [time_now.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3], step, display_label, str(analysis['from_pos_m']), str(analysis['to_pos_m']), f"{analysis['from_row_y_coord_m']:.1f}", f"{analysis['to_row_y_coord_m']:.1f}", analysis['direction'], analysis['action'], analysis['farming_type'], analysis['status'], f"{analysis['distance_m']:.1f}", f"{self.total_dist_m:.1f}", f"{self.total_sow_dist_m:.1f}", self.sown_v_segs, self.sown_h_segs]
-        try:
-            with open(self.csv_filename, 'a', newline='', encoding='utf-8') as f: csv.writer(f).writerow(row)
-        except IOError as e: print(f"❌ CSV Write Err (S{step}): {e}")
+        time_str = time_now.isoformat(sep=' ', timespec='milliseconds')  # One format for both console and CSV
+        # ChainMap layers the per-row values over the analysis without copying it
+        print(self._PRINT_TPL.format_map(ChainMap({'ts': time_str[11:], 'step': step, 'el': elapsed, 'td': self.total_dist_m,
+                                                   'sd': self.total_sow_dist_m, 'vs': self.sown_v_segs, 'hs': self.sown_h_segs}, analysis)))
+        row = [time_str, step, display_label, str(analysis['from_pos_m']), str(analysis['to_pos_m']), f"{analysis['from_row_y_coord_m']:.1f}", f"{analysis['to_row_y_coord_m']:.1f}", analysis['direction'], analysis['action'], analysis['farming_type'], analysis['status'], f"{analysis['distance_m']:.1f}", f"{self.total_dist_m:.1f}", f"{self.total_sow_dist_m:.1f}", self.sown_v_segs, self.sown_h_segs]
+        if self._csv_writer is None: return
+        try: self._csv_writer.writerow(row)
+        except (IOError, ValueError) as e: print(f"❌ CSV Write Err (S{step}): {e}")
 
     def finalize_mission(self, final_pos_m): 
-        end_time = datetime.now(); duration = (end_time - self.start_time).total_seconds()
+        end_time = datetime.now(); duration = time.perf_counter() - self._t0
         eff = (self.total_sow_dist_m / self.total_dist_m * 100) if self.total_dist_m > 0 else 0
         final_pos_str = f"({final_pos_m[0]:.1f}, {final_pos_m[1]:.1f})m"
         summary = f"\n🏁 MISSION COMPLETE! 🏁\n{'='*25}\n📍 End: {final_pos_str}\n⏰ Time: {duration:.2f}s\n📏 TD: {self.total_dist_m:.1f}m\n🌱 SD: {self.total_sow_dist_m:.1f}m ({eff:.1f}%)\n🚜 VS: {self.sown_v_segs}\n↔️ HS: {self.sown_h_segs}\n{'='*25}"
         print(summary)
-        row = [end_time.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3], "FINAL", "End", str(final_pos_m), "", "", "", "", "", "", "", f"{duration:.2f}", f"{self.total_dist_m:.1f}", f"{self.total_sow_dist_m:.1f}", self.sown_v_segs, self.sown_h_segs]
+        row = [end_time.isoformat(sep=' ', timespec='milliseconds'), "FINAL", "End", str(final_pos_m), "", "", "", "", "", "", "", f"{duration:.2f}", f"{self.total_dist_m:.1f}", f"{self.total_sow_dist_m:.1f}", self.sown_v_segs, self.sown_h_segs]
+        if self._csv_fh is None: return
         try:
-            with open(self.csv_filename, 'a', newline='', encoding='utf-8') as f: csv.writer(f).writerow(row)
+            self._csv_writer.writerow(row)
             print(f"💾 Final summary logged to {self.csv_filename}")
-        except IOError as e: print(f"❌ CSV Final Err: {e}")
+        except (IOError, ValueError) as e: print(f"❌ CSV Final Err: {e}")
+        finally:
+            atexit.unregister(self._csv_fh.close)
+            self._csv_fh.close(); self._csv_fh = None; self._csv_writer = None
 
 
 def main():
@@ -1337,7 +1273,7 @@ def main():
     path_data_dict = generate_fixed_path(n_inner_x_sweeps, max_lane_idx_x, max_lane_idx_y, exit_point_lanes, is_corner_exit_choice)
     path_lanes_list_gen, sow_flags_list_gen = path_data_dict['points_lanes'], path_data_dict['sow_flags']
 
-    if not path_lanes_list_gen or len(path_lanes_list_gen) < 2: print("❌ Path generation failed. Exiting."); return None
+    if len(path_lanes_list_gen) < 2: print("❌ Path generation failed. Exiting."); return None
     if len(sow_flags_list_gen) != len(path_lanes_list_gen)-1: 
         print(f"❌ CRITICAL MISMATCH: Sow_flags ({len(sow_flags_list_gen)}) vs segments ({len(path_lanes_list_gen)-1}). Exiting.")
         return None